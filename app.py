@@ -10,11 +10,14 @@ import subprocess
 import customtkinter as ctk
 from tkinter import messagebox
 import threading
+import hashlib
+import multiprocessing
 from PIL import Image
 from bostonkorea_bot import BostonKoreaBot
 from config_manager import load_config, save_config, is_x_configured, is_instagram_configured
 from social_poster import XPoster, InstagramPoster
-from media_generator import CardGenerator, VideoGenerator
+from media_generator import CardGenerator, VideoGenerator, get_card_template
+from article_store import ArticleStore
 
 # 테마 설정
 ctk.set_appearance_mode("dark")
@@ -36,8 +39,13 @@ class BostonKoreaApp(ctk.CTk):
         super().__init__()
 
         self.bot = BostonKoreaBot()
+        self.store = ArticleStore()
         self.articles = []
         self.current_article = None
+        self.current_full_article = None
+        # 이번 실행에서 만든 카드/동영상 (중복 기사 그룹의 대표 URL → 파일 경로)
+        self._rendered_cards = {}
+        self._rendered_videos = {}
         self.config = load_config()
         self.current_result = None
         self.card_image_path = None
@@ -57,7 +65,22 @@ class BostonKoreaApp(ctk.CTk):
         self._create_main_content()
         self._create_footer()
 
-        # 시작 시 기사 로드
+        # 시작 시 bostonkorea.com 연결 예열 후 기사 로드
+        threading.Thread(
+            target=self.bot.http.warmup, args=([BostonKoreaBot.BASE_URL],), daemon=True
+        ).start()
+        # 카드 템플릿(폰트, 그라데이션, 카테고리 뱃지)을 미리 그려서 첫 카드 생성 지연을 줄임
+        threading.Thread(
+            target=lambda: get_card_template(CardGenerator.CARD_SIZE).warmup(
+                self.bot.get_categories().values()),
+            daemon=True,
+        ).start()
+        # 해시태그 단어 통계가 비어 있으면 저장된 기사로 초기화
+        if self.bot.keywords.doc_count == 0:
+            threading.Thread(
+                target=lambda: self.bot.keywords.add_many(self.store.recent(limit=5000)),
+                daemon=True
+            ).start()
         self.after(100, self.load_articles)
 
     def _create_header(self):
@@ -94,7 +117,7 @@ class BostonKoreaApp(ctk.CTk):
         self.refresh_btn = ctk.CTkButton(
             header,
             text="새로고침",
-            command=self.load_articles,
+            command=lambda: self.load_articles(refresh=True),
             width=100
         )
         self.refresh_btn.grid(row=0, column=3, padx=(15, 5), pady=15)
@@ -314,16 +337,36 @@ class BostonKoreaApp(ctk.CTk):
         )
         url_btn.pack(side="right", padx=5, pady=10)
 
+        # 저장된 기사 검색
+        self.search_entry = ctk.CTkEntry(
+            footer,
+            placeholder_text="저장된 기사 검색...",
+            width=180
+        )
+        self.search_entry.pack(side="right", padx=(15, 5), pady=10)
+        self.search_entry.bind("<Return>", lambda event: self.search_articles())
+
+        search_btn = ctk.CTkButton(
+            footer,
+            text="검색",
+            command=self.search_articles,
+            width=60
+        )
+        search_btn.pack(side="right", padx=5, pady=10)
+
     # ===== 기사 로드 / 표시 =====
 
-    def load_articles(self):
-        """기사 목록 로드"""
+    def load_articles(self, refresh=False):
+        """기사 목록 로드 (refresh면 캐시를 무시하고 서버에 재확인)"""
         self.refresh_btn.configure(state="disabled")
         self.status_label.configure(text="기사를 불러오는 중...")
+        if refresh:
+            # 다른 카테고리 목록도 다음에 열 때 서버에서 다시 확인 (기사 본문 캐시는 유지)
+            self.bot.invalidate_cache(lists_only=True)
 
         def fetch():
             category = self.bot.get_categories().get(self.category_var.get(), '')
-            articles = self.bot.fetch_latest_articles(category=category, limit=15)
+            articles = self.bot.fetch_latest_articles(category=category, limit=15, refresh=refresh)
             self.after(0, lambda: self.display_articles(articles))
 
         threading.Thread(target=fetch, daemon=True).start()
@@ -346,7 +389,10 @@ class BostonKoreaApp(ctk.CTk):
                 self._create_article_card(i, article)
 
         self.refresh_btn.configure(state="normal")
-        self.status_label.configure(text=f"{len(articles)}개 기사 로드됨")
+        stats = self.bot.cache_stats()['memory']
+        self.status_label.configure(
+            text=f"{len(articles)}개 기사 로드됨 (캐시 적중 {stats['hits']}/{stats['hits'] + stats['misses']})"
+        )
 
     def _create_article_card(self, index, article):
         """기사 카드 생성"""
@@ -366,6 +412,15 @@ class BostonKoreaApp(ctk.CTk):
         )
         title_btn.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
 
+        if article.get('duplicate_of'):
+            ctk.CTkLabel(
+                card,
+                text="중복",
+                font=ctk.CTkFont(size=11),
+                fg_color=("#f5c6a5", "#7a4a2a"),
+                corner_radius=4
+            ).grid(row=0, column=2, padx=(0, 10), pady=10)
+
         if article.get('category'):
             ctk.CTkLabel(
                 card,
@@ -381,6 +436,7 @@ class BostonKoreaApp(ctk.CTk):
         """기사 선택 및 변환"""
         self.status_label.configure(text="기사를 변환하는 중...")
         self.current_article = article
+        self.current_full_article = None
         self.card_image_path = None
         self.video_path = None
         self.play_video_btn.configure(state="disabled")
@@ -389,6 +445,7 @@ class BostonKoreaApp(ctk.CTk):
         def process():
             try:
                 full_article = self.bot.fetch_article(article['url'])
+                self.store.upsert(full_article)
                 result = self.bot.format_for_both(full_article)
                 self.after(0, lambda: self.display_result(result, full_article))
             except Exception as e:
@@ -399,6 +456,7 @@ class BostonKoreaApp(ctk.CTk):
     def display_result(self, result, full_article=None):
         """결과 표시 + 카드 미리보기 생성"""
         self.current_result = result
+        self.current_full_article = full_article
 
         # X 텍스트
         self.x_textbox.configure(state="normal")
@@ -417,18 +475,36 @@ class BostonKoreaApp(ctk.CTk):
         title = full_article['title'] if full_article else "제목 없음"
         category = full_article.get('category', '') if full_article else ''
 
+        # 이미 카드를 만든 기사와 중복이면 다시 렌더링하지 않음
+        render_key = self.bot.dedup.canonical(full_article) if full_article else None
+        cached_card = self._rendered_cards.get(render_key)
+        if cached_card and os.path.exists(cached_card):
+            self.card_image_path = cached_card
+            self._show_card_preview(cached_card)
+            return
+
         def gen_card():
             try:
                 generator = CardGenerator()
-                output = os.path.join(GENERATED_DIR, "card_preview.png")
+                output = os.path.join(GENERATED_DIR, self._render_name("card", render_key, "png"))
                 _, path = generator.generate(title, category, image_url, output)
                 self.card_image_path = path
+                if render_key:
+                    self._rendered_cards[render_key] = path
                 self.after(0, lambda: self._show_card_preview(path))
             except Exception as e:
                 self.after(0, lambda: self._on_card_error(str(e)))
 
         threading.Thread(target=gen_card, daemon=True).start()
 
+    @staticmethod
+    def _render_name(prefix, render_key, ext):
+        """중복 기사 그룹별 결과 파일 이름"""
+        if not render_key:
+            return f"{prefix}_preview.{ext}"
+        digest = hashlib.sha1(render_key.encode("utf-8")).hexdigest()[:12]
+        return f"{prefix}_{digest}.{ext}"
+
     def _show_card_preview(self, card_path):
         """카드 미리보기 표시"""
         try:
@@ -463,6 +539,14 @@ class BostonKoreaApp(ctk.CTk):
             messagebox.showwarning("알림", "먼저 기사를 선택하세요. 카드 이미지가 필요합니다.")
             return
 
+        render_key = (self.bot.dedup.canonical(self.current_full_article)
+                      if self.current_full_article else None)
+        cached_video = self._rendered_videos.get(render_key)
+        if cached_video and os.path.exists(cached_video):
+            self.video_path = cached_video
+            self._on_video_success(cached_video)
+            return
+
         self.gen_video_btn.configure(state="disabled")
         self.play_video_btn.configure(state="disabled")
         self.video_status_label.configure(text="동영상 생성 중...")
@@ -475,11 +559,13 @@ class BostonKoreaApp(ctk.CTk):
         def do_gen():
             try:
                 generator = VideoGenerator()
-                output = os.path.join(GENERATED_DIR, "card_video.mp4")
+                output = os.path.join(GENERATED_DIR, self._render_name("video", render_key, "mp4"))
                 path = generator.generate(
                     self.card_image_path, output,
                     on_progress=on_progress)
                 self.video_path = path
+                if render_key:
+                    self._rendered_videos[render_key] = path
                 self.after(0, lambda: self._on_video_success(path))
             except Exception as e:
                 self.after(0, lambda: self._on_video_error(str(e)))
@@ -544,6 +630,19 @@ class BostonKoreaApp(ctk.CTk):
         self.select_article({'url': url, 'title': 'URL에서 로드'})
         self.url_entry.delete(0, "end")
 
+    def search_articles(self):
+        """저장된 기사 전문 검색 결과를 목록에 표시"""
+        query = self.search_entry.get().strip()
+        results = self.store.search(query, limit=50)
+        # 저장된 행에는 duplicate_of가 없으므로 중복 인덱스로 계산 ("중복" 뱃지)
+        for article in results:
+            article['duplicate_of'] = self.bot.dedup.duplicate_of(article)
+        self.display_articles(results)
+        if query:
+            self.status_label.configure(text=f"'{query}' 검색 결과 {len(results)}개")
+        else:
+            self.status_label.configure(text=f"최근 저장된 기사 {len(results)}개")
+
     def on_category_change(self, value):
         """카테고리 변경"""
         self.load_articles()
@@ -561,6 +660,10 @@ class BostonKoreaApp(ctk.CTk):
             messagebox.showwarning("설정 필요", "X API 키가 설정되지 않았습니다.\n설정 버튼에서 API 키를 입력하세요.")
             return
 
+        article = self.current_full_article
+        if not self._confirm_not_duplicate(article, "x", "X"):
+            return
+
         self.x_post_btn.configure(state="disabled")
         self.status_label.configure(text="X에 게시하는 중...")
 
@@ -572,6 +675,8 @@ class BostonKoreaApp(ctk.CTk):
                     x_cfg["access_token"], x_cfg["access_token_secret"]
                 )
                 tweet_id = poster.post(text)
+                if article:
+                    self.bot.dedup.mark_posted(article, "x")
                 self.after(0, lambda: self._on_post_success("X", tweet_id))
             except Exception as e:
                 self.after(0, lambda: self._on_post_error("X", str(e)))
@@ -594,6 +699,10 @@ class BostonKoreaApp(ctk.CTk):
             messagebox.showwarning("알림", "이미지가 없는 기사는 인스타그램에 게시할 수 없습니다.")
             return
 
+        article = self.current_full_article
+        if not self._confirm_not_duplicate(article, "instagram", "인스타그램"):
+            return
+
         self.ig_post_btn.configure(state="disabled")
         self.status_label.configure(text="인스타그램에 게시하는 중...")
 
@@ -602,12 +711,26 @@ class BostonKoreaApp(ctk.CTk):
                 ig_cfg = self.config["instagram"]
                 poster = InstagramPoster(ig_cfg["username"], ig_cfg["password"])
                 media_id = poster.post(caption, image_url)
+                if article:
+                    self.bot.dedup.mark_posted(article, "instagram")
                 self.after(0, lambda: self._on_post_success("인스타그램", media_id))
             except Exception as e:
                 self.after(0, lambda: self._on_post_error("인스타그램", str(e)))
 
         threading.Thread(target=do_post, daemon=True).start()
 
+    def _confirm_not_duplicate(self, article, platform_key, platform_name):
+        """같은(비슷한) 기사를 이미 게시했으면 다시 게시할지 확인"""
+        if not article:
+            return True
+        posted_url = self.bot.dedup.posted_duplicate(article, platform_key)
+        if not posted_url:
+            return True
+        return messagebox.askyesno(
+            "중복 게시",
+            f"같은 내용의 기사가 이미 {platform_name}에 게시되었습니다.\n{posted_url}\n\n그래도 게시할까요?"
+        )
+
     def _on_post_success(self, platform_name, post_id):
         """게시 성공 콜백"""
         self.status_label.configure(text=f"{platform_name} 게시 완료! (ID: {post_id})")
@@ -727,5 +850,7 @@ class BostonKoreaApp(ctk.CTk):
 
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 카드 일괄 생성 워커 프로세스(spawn)가 앱을 다시 띄우지 않도록
+    multiprocessing.freeze_support()
     app = BostonKoreaApp()
     app.mainloop()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+기사 저장소 모듈 - 가져온 기사를 SQLite에 보관하고 전문 검색
+- ArticleStore: URL 기본키 테이블 + FTS5 trigram 색인 (한국어는 띄어쓰기 단위로
+  자르면 조사 때문에 검색이 안 되므로 글자 3-gram 단위로 색인)
+"""
+
+import sqlite3
+import threading
+import time
+
+from config_manager import ARTICLE_DB
+
+COLUMNS = ('url', 'title', 'content', 'date', 'category', 'image_url')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url        TEXT PRIMARY KEY,
+    title      TEXT NOT NULL DEFAULT '',
+    content    TEXT NOT NULL DEFAULT '',
+    date       TEXT NOT NULL DEFAULT '',
+    category   TEXT NOT NULL DEFAULT '',
+    image_url  TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_fetched ON articles(category, fetched_at);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, content, content='articles', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, content)
+    VALUES ('delete', old.rowid, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, content)
+    VALUES ('delete', old.rowid, old.title, old.content);
+    INSERT INTO articles_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+"""
+
+# 빈 값으로 들어온 필드는 기존 값을 유지 (목록 항목처럼 본문 없는 기사도 upsert 가능)
+_UPSERT = """
+INSERT INTO articles (url, title, content, date, category, image_url, fetched_at)
+VALUES (:url, :title, :content, :date, :category, :image_url, :fetched_at)
+ON CONFLICT(url) DO UPDATE SET
+    title      = COALESCE(NULLIF(excluded.title, ''), articles.title),
+    content    = COALESCE(NULLIF(excluded.content, ''), articles.content),
+    date       = COALESCE(NULLIF(excluded.date, ''), articles.date),
+    category   = COALESCE(NULLIF(excluded.category, ''), articles.category),
+    image_url  = COALESCE(excluded.image_url, articles.image_url),
+    fetched_at = excluded.fetched_at
+"""
+
+# trigram 토크나이저는 3글자 이상만 색인 검색 가능
+_MIN_FTS_TERM = 3
+
+
+class ArticleStore:
+    """기사 SQLite 저장소. 하나의 연결을 잠금으로 보호해서 여러 스레드에서 공유."""
+
+    def __init__(self, path=ARTICLE_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:
+                # SQLite 3.34 미만: trigram 없음 → LIKE 검색으로 대체
+                self.fts = False
+
+    @staticmethod
+    def _row(article, now):
+        row = {key: article.get(key) or '' for key in COLUMNS}
+        row['image_url'] = article.get('image_url') or None
+        row['fetched_at'] = now
+        return row
+
+    def upsert(self, article: dict) -> None:
+        """기사 한 건 저장 (URL이 같으면 갱신)."""
+        self.upsert_many([article])
+
+    def upsert_many(self, articles) -> int:
+        """여러 기사를 한 트랜잭션으로 저장. 저장한 건수 반환."""
+        now = time.time()
+        rows = [self._row(article, now) for article in articles if article.get('url')]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def get(self, url: str):
+        """URL로 기사 조회. 없으면 None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, title, content, date, category, image_url FROM articles WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def search(self, query: str, limit: int = 20, category: str = None) -> list:
+        """
+        제목/본문 전문 검색.
+
+        공백으로 나눈 검색어를 모두 포함하는 기사를 반환합니다. 3글자 이상
+        검색어는 FTS5 trigram 색인으로, 2글자 이하 검색어(예: '경제')는 색인으로
+        좁힌 결과 위에서 LIKE로 거릅니다.
+        """
+        terms = query.split()
+        if not terms:
+            return self.recent(limit, category)
+
+        fts_terms = [t for t in terms if len(t) >= _MIN_FTS_TERM] if self.fts else []
+        like_terms = [t for t in terms if t not in fts_terms]
+
+        params = []
+        if fts_terms:
+            sql = ("SELECT a.url, a.title, a.content, a.date, a.category, a.image_url "
+                   "FROM articles_fts JOIN articles a ON a.rowid = articles_fts.rowid "
+                   "WHERE articles_fts MATCH ?")
+            params.append(' AND '.join('"' + t.replace('"', '""') + '"' for t in fts_terms))
+            order = "ORDER BY articles_fts.rank"
+        else:
+            sql = ("SELECT a.url, a.title, a.content, a.date, a.category, a.image_url "
+                   "FROM articles a WHERE 1")
+            order = "ORDER BY a.fetched_at DESC"
+
+        for term in like_terms:
+            escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            sql += " AND (a.title LIKE ? ESCAPE '\\' OR a.content LIKE ? ESCAPE '\\')"
+            params += [f"%{escaped}%", f"%{escaped}%"]
+        if category:
+            sql += " AND a.category = ?"
+            params.append(category)
+        sql += f" {order} LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def recent(self, limit: int = 20, category: str = None) -> list:
+        """최근 저장된 기사 목록."""
+        sql = "SELECT url, title, content, date, category, image_url FROM articles"
+        params = []
+        if category:
+            sql += " WHERE category = ?"
+            params.append(category)
+        sql += " ORDER BY fetched_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
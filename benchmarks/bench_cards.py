@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+카드 생성 벤치마크 - 기사 목록 전체의 카드를 만들 때 처리량 비교
+- legacy: 이전 방식 (카드마다 그라데이션 줄 그리기 + RGBA 합성 + 뱃지/브랜딩 다시 그림)
+- template: CardTemplate (고정 레이어 재사용, 제목만 새로 그림)
+각 방식은 사진 디코딩, 합성, PNG 저장을 나눠 측정합니다.
+--workers를 주면 CardGenerator.generate_many의 워커 수별 처리량도 측정합니다.
+사진은 실행 시 임시 폴더에 만든 합성 JPEG(기사 사진 크기)를 사용하므로
+네트워크 없이 돌아갑니다.
+
+사용법:
+    python benchmarks/bench_cards.py [--cards 24] [--photo-size 1600x1200] [--workers 1 2 4]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from PIL import Image, ImageDraw  # noqa: E402
+
+import media_generator  # noqa: E402
+from bostonkorea_bot import BostonKoreaBot  # noqa: E402
+from media_generator import (  # noqa: E402
+    CardGenerator, _crop_to_fill, _load_font, _wrap_text, get_card_template,
+)
+
+TITLES = [
+    "보스톤 시의회, 새 예산안 통과",
+    "매사추세츠 주정부, 내년부터 최저임금 15달러로 인상… 소상공인 부담 우려 목소리도",
+    ("하버드대학 연구팀, 알츠하이머 조기 진단을 위한 새로운 혈액 검사법 개발에 성공했다고 "
+     "발표… 임상시험 결과 기존 검사 대비 정확도 크게 높아져 상용화 기대감 커져"),
+    "MBTA 그린라인 연장 구간 개통, 메드포드·서머빌 주민 출퇴근 시간 단축",
+]
+
+
+def legacy_render(title, category, bg):
+    """이전 CardGenerator.generate의 렌더링 부분 (비교용)"""
+    w, h = bg.size
+    card = bg.convert("RGBA")
+    overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    draw_overlay = ImageDraw.Draw(overlay)
+    gradient_start = int(h * 0.4)
+    for y in range(gradient_start, h):
+        alpha = int(220 * (y - gradient_start) / (h - gradient_start))
+        draw_overlay.line([(0, y), (w, y)], fill=(0, 0, 0, alpha))
+    card = Image.alpha_composite(card, overlay)
+    draw = ImageDraw.Draw(card)
+
+    title_font = _load_font(*CardGenerator.TITLE_FONT)
+    cat_font = _load_font(*CardGenerator.CATEGORY_FONT)
+    brand_font = _load_font(*CardGenerator.BRAND_FONT)
+
+    if category:
+        cat_text = f"  {category}  "
+        cat_bbox = draw.textbbox((0, 0), cat_text, font=cat_font)
+        pad = 8
+        draw.rounded_rectangle(
+            [40, 40, 40 + cat_bbox[2] - cat_bbox[0] + pad * 2,
+             40 + cat_bbox[3] - cat_bbox[1] + pad * 2],
+            radius=8, fill=(220, 50, 50, 200))
+        draw.text((40 + pad, 40 + pad), cat_text, font=cat_font, fill="white")
+
+    lines = _wrap_text(title, title_font, w - 120)
+    text_y = h - 140 - len(lines) * 64
+    for line in lines:
+        draw.text((62, text_y + 2), line, font=title_font, fill=(0, 0, 0, 180))
+        draw.text((60, text_y), line, font=title_font, fill="white")
+        text_y += 64
+
+    draw.text((60, h - 65), "보스톤코리아  |  bostonkorea.com", font=brand_font,
+              fill=(200, 200, 200, 220))
+    return card.convert("RGB")
+
+
+def _make_photo(directory, size):
+    """부드러운 색 변화 + 잡음이 섞인 합성 사진 (JPEG 압축률이 실제 사진과 비슷하도록)."""
+    w, h = size
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:h, 0:w]
+    base = np.stack([x / w * 200, y / h * 180, (x + y) / (w + h) * 220], axis=2)
+    noise = rng.normal(0, 12, (h, w, 3))
+    path = os.path.join(directory, "photo.jpg")
+    Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8)).save(path, quality=85)
+    return path
+
+
+def _run(articles, render, compress_level, directory):
+    """([사진 디코딩, 합성, 저장] 초, 평균 파일 크기) 반환."""
+    w, h = CardGenerator.CARD_SIZE
+    phases = [0.0, 0.0, 0.0]
+    total_bytes = 0
+    for i, (title, category, photo) in enumerate(articles):
+        t0 = time.perf_counter()
+        if photo:
+            with Image.open(photo) as img:
+                bg = _crop_to_fill(img, w, h)
+        else:
+            bg = media_generator._default_background(w, h).copy()
+        t1 = time.perf_counter()
+        card = render(title, category, bg)
+        t2 = time.perf_counter()
+        path = os.path.join(directory, f"card_{i}.png")
+        card.save(path, "PNG", compress_level=compress_level)
+        t3 = time.perf_counter()
+        for j, seconds in enumerate((t1 - t0, t2 - t1, t3 - t2)):
+            phases[j] += seconds
+        total_bytes += os.path.getsize(path)
+    return phases, total_bytes / len(articles)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카드 생성 벤치마크")
+    parser.add_argument("--cards", type=int, default=24, help="만들 카드 수")
+    parser.add_argument("--photo-size", default="1600x1200", help="합성 사진 크기 (WxH)")
+    parser.add_argument("--workers", type=int, nargs="*", default=[],
+                        help="generate_many 워커 수 (여러 개 지정 가능)")
+    args = parser.parse_args()
+
+    photo_size = tuple(int(v) for v in args.photo_size.lower().split("x"))
+    categories = [c for c in BostonKoreaBot().get_categories().values() if c]
+
+    with tempfile.TemporaryDirectory() as directory:
+        photo = _make_photo(directory, photo_size)
+        # 사진 있는 기사 3개당 사진 없는 기사 1개
+        articles = [
+            (title, category, photo if i % 4 else None)
+            for i, (title, category) in enumerate(
+                itertools.islice(zip(itertools.cycle(TITLES), itertools.cycle(categories)),
+                                 args.cards))
+        ]
+
+        template = get_card_template(CardGenerator.CARD_SIZE)
+        template.warmup(categories)
+        # 워밍업 (폰트 로드, 글자 폭 캐시)
+        _run(articles[:4], legacy_render, 6, directory)
+        _run(articles[:4], template.render, 6, directory)
+
+        modes = [
+            ("legacy", legacy_render, 6),
+            ("template", template.render, 6),
+            (f"template+png{media_generator.PNG_COMPRESS_LEVEL}", template.render,
+             media_generator.PNG_COMPRESS_LEVEL),
+        ]
+        print(f"{args.cards} cards, photo {photo_size[0]}x{photo_size[1]} (1 in 4 without photo)")
+        print(f"{'mode':<16}{'decode ms':>10}{'compose ms':>11}{'save ms':>9}"
+              f"{'cards/s':>9}{'KiB':>7}{'compose x':>10}{'total x':>9}")
+        baseline = None
+        n = len(articles)
+        for name, render, level in modes:
+            (decode_s, compose_s, save_s), size = _run(articles, render, level, directory)
+            total = decode_s + compose_s + save_s
+            baseline = baseline or (compose_s, total)
+            print(f"{name:<16}{decode_s / n * 1000:>10.1f}{compose_s / n * 1000:>11.1f}"
+                  f"{save_s / n * 1000:>9.1f}{n / total:>9.1f}{size / 1024:>7.0f}"
+                  f"{baseline[0] / compose_s:>9.1f}x{baseline[1] / total:>8.1f}x")
+
+        if args.workers:
+            _run_many(articles, args.workers, directory)
+
+
+def _run_many(articles, worker_counts, directory):
+    """generate_many 워커 수별 처리량 (워커 시작 시간 포함)."""
+    jobs = [{'url': f"bench://{i}", 'title': title, 'category': category, 'image_url': photo}
+            for i, (title, category, photo) in enumerate(articles)]
+    generator = CardGenerator()
+    print(f"\ngenerate_many ({os.cpu_count()} CPUs)")
+    print(f"{'workers':<9}{'first card s':>13}{'total s':>9}{'cards/s':>9}{'speedup':>9}")
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        first = None
+        for _, _, error in generator.generate_many(jobs, workers=workers, output_dir=directory):
+            if error is not None:
+                raise error
+            first = first or time.perf_counter() - start
+        total = time.perf_counter() - start
+        baseline = baseline or total
+        print(f"{workers:<9}{first:>13.2f}{total:>9.2f}{len(jobs) / total:>9.1f}"
+              f"{baseline / total:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
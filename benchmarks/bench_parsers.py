@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+파싱 벤치마크 - 저장된 게시판/기사 HTML로 파서 백엔드별 속도와 메모리 측정 (오프라인)
+
+fixtures/ 의 스냅샷을 설치된 모든 백엔드(selectolax / lxml / html.parser)와
+기사 파싱 모드(full / selective)로 파싱해서 다음을 보고합니다.
+  - ms/page, pages/s (중앙값 기준)
+  - peak KiB (tracemalloc로 측정한 파싱 1회의 최대 메모리 할당량)
+파싱 결과가 fixtures/expected.json과 다르면 실패합니다.
+
+사용법:
+    python benchmarks/bench_parsers.py                 # 전체 fixture
+    python benchmarks/bench_parsers.py --check         # thresholds.json 기준 회귀 검사 (실패 시 exit 1)
+    python benchmarks/bench_parsers.py --update-thresholds   # 현재 측정값 x 여유 배수로 기준 갱신
+    python benchmarks/bench_parsers.py --update-expected     # 선택자 변경 후 정답 출력 갱신
+    python benchmarks/bench_parsers.py --board saved_board.html --article saved_article.html
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from bostonkorea_bot import BostonKoreaBot  # noqa: E402
+from dedup import DuplicateIndex  # noqa: E402
+from hashtags import KeywordIndex  # noqa: E402
+from html_parser import available_backends  # noqa: E402
+from http_cache import HttpCache  # noqa: E402
+
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+EXPECTED_FILE = os.path.join(FIXTURE_DIR, "expected.json")
+THRESHOLDS_FILE = os.path.join(BENCH_DIR, "thresholds.json")
+
+# fixture 파일 → (종류, parse_article_list에 넘길 category)
+FIXTURES = {
+    "board.html": ("board", None),
+    "board_category.html": ("board", "경제"),
+    "board_fallback.html": ("board", None),
+    "article.html": ("article", None),
+    "article_short.html": ("article", None),
+}
+
+# --update-thresholds 시 측정값에 곱할 여유 배수 (기기 차이 흡수)
+THRESHOLD_MARGIN = 3.0
+
+FIXTURE_URL = "https://www.bostonkorea.com/news/fixture"
+
+
+def _make_parse(kind, backend, selective, category, cache_dir):
+    """
+    파싱 함수. 봇은 네트워크 없이 파싱만 하므로 HTTP 클라이언트는 쓰지 않고
+    캐시/키워드/중복 인덱스도 임시 폴더와 메모리에만 둠 (앱 상태 파일을 만들거나 건드리지 않음).
+    """
+    bot = BostonKoreaBot(http=object(), cache=HttpCache(cache_dir), parser=backend,
+                         selective=selective, keywords=KeywordIndex(path=None),
+                         dedup=DuplicateIndex(path=None))
+    if kind == "board":
+        return lambda html: bot.parse_article_list(html, 15, category)
+    return lambda html: bot.parse_article(html, FIXTURE_URL)
+
+
+def _cases(pages):
+    """(fixture 이름, 종류, 백엔드, 모드, category) 조합."""
+    for name, (kind, category) in pages.items():
+        for backend in available_backends():
+            modes = ["full"]
+            # selective는 BeautifulSoup 백엔드의 기사 파싱에만 의미가 있음
+            if kind == "article" and backend != "selectolax":
+                modes.append("selective")
+            for mode in modes:
+                yield name, kind, backend, mode, category
+
+
+def _measure(parse, html, repeat):
+    parse(html)  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(html)
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(samples), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파서 백엔드 벤치마크")
+    parser.add_argument("--board", nargs="*", default=[], help="추가로 측정할 게시판 HTML")
+    parser.add_argument("--article", nargs="*", default=[], help="추가로 측정할 기사 HTML")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--check", action="store_true", help="thresholds.json 기준 회귀 검사")
+    parser.add_argument("--update-thresholds", action="store_true")
+    parser.add_argument("--update-expected", action="store_true")
+    args = parser.parse_args()
+
+    pages = {}
+    paths = {}
+    if args.board or args.article:
+        for path in args.board:
+            pages[os.path.basename(path)] = ("board", None)
+            paths[os.path.basename(path)] = path
+        for path in args.article:
+            pages[os.path.basename(path)] = ("article", None)
+            paths[os.path.basename(path)] = path
+    else:
+        pages = dict(FIXTURES)
+        paths = {name: os.path.join(FIXTURE_DIR, name) for name in pages}
+
+    expected = {}
+    if os.path.exists(EXPECTED_FILE):
+        with open(EXPECTED_FILE, "r", encoding="utf-8") as f:
+            expected = json.load(f)
+    thresholds = {}
+    if os.path.exists(THRESHOLDS_FILE):
+        with open(THRESHOLDS_FILE, "r", encoding="utf-8") as f:
+            thresholds = json.load(f)
+
+    # 봇의 HTTP 캐시 폴더 (프로세스 종료 시 삭제)
+    cache_dir = tempfile.TemporaryDirectory(prefix="bench_parsers_")
+    html_cache = {}
+    updated = {}
+    results = {}
+    failures = []
+
+    print(f"{'fixture':<22}{'backend':<13}{'mode':<11}{'ms/page':>9}{'pages/s':>10}{'peak KiB':>10}")
+    for name, kind, backend, mode, category in _cases(pages):
+        if name not in html_cache:
+            with open(paths[name], "rb") as f:
+                html_cache[name] = f.read()
+        html = html_cache[name]
+        parse = _make_parse(kind, backend, mode == "selective", category, cache_dir.name)
+
+        output = parse(html)
+        if args.update_expected:
+            # 첫 백엔드 출력을 정답으로 쓰고, 나머지 백엔드/모드는 그와 같아야 함
+            if name not in updated:
+                updated[name] = output
+            elif output != updated[name]:
+                failures.append(f"{name} [{backend}/{mode}]: 백엔드 간 파싱 결과가 다름")
+        elif name in expected and output != expected[name]:
+            failures.append(f"{name} [{backend}/{mode}]: 파싱 결과가 expected.json과 다름")
+
+        seconds, peak = _measure(parse, html, args.repeat)
+        ms, peak_kib = seconds * 1000, peak / 1024
+        key = f"{name}|{backend}|{mode}"
+        results[key] = {"max_ms": ms, "max_peak_kib": peak_kib}
+        print(f"{name:<22}{backend:<13}{mode:<11}{ms:>9.2f}{1 / seconds:>10.0f}{peak_kib:>10.0f}")
+
+        limit = thresholds.get(key)
+        if args.check and limit:
+            if ms > limit["max_ms"]:
+                failures.append(f"{key}: {ms:.2f}ms > {limit['max_ms']:.2f}ms")
+            if peak_kib > limit["max_peak_kib"]:
+                failures.append(f"{key}: {peak_kib:.0f}KiB > {limit['max_peak_kib']:.0f}KiB")
+
+    if args.update_expected and not failures:
+        expected.update(updated)
+        with open(EXPECTED_FILE, "w", encoding="utf-8") as f:
+            json.dump(expected, f, ensure_ascii=False, indent=2)
+        print(f"\n정답 출력 저장: {EXPECTED_FILE}")
+
+    if args.update_thresholds:
+        for key, value in results.items():
+            thresholds[key] = {
+                "max_ms": round(value["max_ms"] * THRESHOLD_MARGIN, 2),
+                "max_peak_kib": round(value["max_peak_kib"] * THRESHOLD_MARGIN),
+            }
+        with open(THRESHOLDS_FILE, "w", encoding="utf-8") as f:
+            json.dump(thresholds, f, indent=2, sort_keys=True)
+        print(f"\n회귀 기준 저장: {THRESHOLDS_FILE}")
+
+    if failures:
+        print("\n실패:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+줌 동영상 생성 벤치마크 - 이전 프레임 생성(crop 사본 → resize → np.array 사본 → imageio)과
+VideoGenerator의 python 백엔드(샘플링 영역 직접 resize → 바이트를 ffmpeg 파이프로),
+ffmpeg 백엔드(zoompan 필터로 프레임 생성 + 인코딩) 비교.
+--preset/--crf/--threads는 세 방식 모두에 같은 인코더 옵션으로 적용합니다.
+최대 메모리(peak RSS)를 방식별로 재기 위해 측정마다 새 프로세스에서 실행합니다
+(Windows에서는 ffmpeg 자식 프로세스의 peak RSS가 표시되지 않음).
+
+사용법:
+    python benchmarks/bench_video.py [--card path.png] [--config 4x15 8x30]
+                                     [--preset veryfast] [--crf 23] [--threads 2]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PIL import Image  # noqa: E402
+
+from media_generator import CardGenerator, VideoGenerator, _peak_rss_mb  # noqa: E402
+
+
+def legacy_generate(card_image_path, output_path, duration, fps, encoder_params):
+    """이전 VideoGenerator.generate (비교용). 프레임 생성 초를 반환."""
+    import numpy as np
+    import imageio
+
+    vw, vh = VideoGenerator.VIDEO_SIZE
+    img = Image.open(card_image_path).convert("RGB").resize((vw, vh), Image.BILINEAR)
+    total_frames = duration * fps
+    writer = imageio.get_writer(output_path, fps=fps, macro_block_size=1,
+                                ffmpeg_params=encoder_params)
+    render_seconds = 0.0
+    for i in range(total_frames):
+        start = time.perf_counter()
+        zoom = 1.0 + 0.10 * i / total_frames
+        new_w, new_h = int(vw / zoom), int(vh / zoom)
+        left, top = (vw - new_w) // 2, (vh - new_h) // 2
+        cropped = img.crop((left, top, left + new_w, top + new_h))
+        frame = np.array(cropped.resize((vw, vh), Image.BILINEAR))
+        render_seconds += time.perf_counter() - start
+        writer.append_data(frame)
+    writer.close()
+    return render_seconds
+
+
+def _measure(mode, card, duration, fps, options):
+    """(자식 프로세스) 한 번 생성하고 결과를 JSON으로 출력."""
+    fd, output = tempfile.mkstemp(suffix=".mp4")
+    os.close(fd)
+    try:
+        frames = duration * fps
+        generator = VideoGenerator(backend="python" if mode == "legacy" else mode, **options)
+        start = time.perf_counter()
+        if mode == "legacy":
+            render_seconds = legacy_generate(card, output, duration, fps,
+                                             generator._encoder_params())
+            seconds = time.perf_counter() - start
+            peak, encoder_peak = _peak_rss_mb()
+            stats = {"fps": frames / seconds, "render_fps": frames / render_seconds,
+                     "peak_rss_mb": peak, "encoder_peak_rss_mb": encoder_peak}
+        else:
+            generator.generate(card, output, duration=duration, fps=fps)
+            stats = dict(generator.last_stats)
+        stats["frames"] = frames
+        print(json.dumps(stats))
+    finally:
+        os.unlink(output)
+
+
+def _fmt(value, width):
+    """측정값 (Windows의 ffmpeg peak RSS, ffmpeg 백엔드의 render fps처럼 없으면 '-')."""
+    return f"{value:>{width}.1f}" if value is not None else f"{'-':>{width}}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="줌 동영상 생성 벤치마크")
+    parser.add_argument("--card", help="카드 이미지 (없으면 기본 배경 카드를 만들어 사용)")
+    parser.add_argument("--config", nargs="*", default=["4x15", "8x30"],
+                        help="길이(초)x프레임레이트 목록")
+    parser.add_argument("--preset", help="x264 프리셋 (예: veryfast)")
+    parser.add_argument("--crf", type=int, help="x264 CRF (0~51)")
+    parser.add_argument("--threads", type=int, help="인코더 스레드 수")
+    parser.add_argument("--child", nargs=4, metavar=("MODE", "CARD", "DURATION", "FPS"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    options = {"preset": args.preset, "crf": args.crf, "threads": args.threads}
+    if args.child:
+        mode, card, duration, fps = args.child
+        _measure(mode, card, int(duration), int(fps), options)
+        return
+    passthrough = [arg for name, value in options.items() if value is not None
+                   for arg in (f"--{name}", str(value))]
+
+    with tempfile.TemporaryDirectory() as directory:
+        card = args.card
+        if not card:
+            card = os.path.join(directory, "card.png")
+            CardGenerator().generate("보스톤 시의회, 새 예산안 통과… 주민 의견 수렴 거쳐 내달 시행",
+                                     "미국", None, card)
+
+        print(f"{'config':<8}{'mode':<8}{'frames':>7}{'fps':>8}{'render fps':>12}"
+              f"{'peak MB':>9}{'ffmpeg MB':>11}")
+        for config in args.config:
+            duration, fps = (int(v) for v in config.split("x"))
+            for mode in ("legacy", "python", "ffmpeg"):
+                out = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--child", mode, card,
+                     str(duration), str(fps), *passthrough],
+                    capture_output=True, text=True, check=True, cwd=ROOT)
+                stats = json.loads(out.stdout.strip().splitlines()[-1])
+                print(f"{config:<8}{mode:<8}{stats['frames']:>7}{stats['fps']:>8.1f}"
+                      f"{_fmt(stats['render_fps'], 12)}{_fmt(stats['peak_rss_mb'], 9)}"
+                      f"{_fmt(stats['encoder_peak_rss_mb'], 11)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+제목 줄바꿈 벤치마크 - 이전 _wrap_text(글자마다 textbbox로 줄 전체 재측정)와
+현재 _wrap_text(글자 폭 캐시 + 어절 단위 줄바꿈) 비교
+
+사용법:
+    python benchmarks/bench_wrap.py [--repeat 200]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+from media_generator import CardGenerator, _load_font, _wrap_text  # noqa: E402
+
+TITLES = {
+    "short": "보스톤 시의회, 새 예산안 통과",
+    "medium": "매사추세츠 주정부, 내년부터 최저임금 15달러로 인상… 소상공인 부담 우려 목소리도",
+    "long": ("하버드대학 연구팀, 알츠하이머 조기 진단을 위한 새로운 혈액 검사법 개발에 성공했다고 "
+             "발표… 임상시험 결과 기존 검사 대비 정확도 크게 높아져 상용화 기대감 커져"),
+    "no_spaces": "보스톤코리아창간20주년기념특별기획시리즈재미한인이민사의어제와오늘그리고내일" * 2,
+}
+
+
+def legacy_wrap_text(text, font, max_width, draw):
+    """이전 구현 (비교용)"""
+    lines = []
+    current_line = ""
+
+    for char in text:
+        test_line = current_line + char
+        bbox = draw.textbbox((0, 0), test_line, font=font)
+        if bbox[2] - bbox[0] > max_width and current_line:
+            lines.append(current_line)
+            current_line = char
+        else:
+            current_line = test_line
+
+    if current_line:
+        lines.append(current_line)
+
+    return lines[:4]
+
+
+def _time(func, repeat):
+    func()  # 워밍업 (글자 폭 캐시 채우기 포함)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제목 줄바꿈 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    font = _load_font(*CardGenerator.TITLE_FONT)
+    draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    max_width = CardGenerator.CARD_SIZE[0] - 120
+
+    print(f"{'title':<11}{'chars':>6}{'legacy ms':>11}{'new ms':>9}{'speedup':>9}")
+    for name, title in TITLES.items():
+        old = _time(lambda: legacy_wrap_text(title, font, max_width, draw), args.repeat)
+        new = _time(lambda: _wrap_text(title, font, max_width), args.repeat)
+        print(f"{name:<11}{len(title):>6}{old * 1000:>11.3f}{new * 1000:>9.3f}{old / new:>8.1f}x")
+
+    print()
+    for name, title in TITLES.items():
+        print(f"[{name}]")
+        for line in _wrap_text(title, font, max_width):
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
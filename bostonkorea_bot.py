@@ -4,32 +4,204 @@
 인스타그램과 X(트위터)용 텍스트를 자동 생성합니다.
 """
 
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import unquote
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import unquote, urlsplit
+import asyncio
 import re
 import sys
 import pyperclip
 
+from http_client import get_client
+from http_cache import get_http_cache
+from html_parser import parse_html, default_backend
+from crawler import crawl_categories
+from article_store import ArticleStore
+from memory_cache import TTLCache
+from summarizer import summarize, summarize_many
+from hashtags import get_keyword_index
+from dedup import get_duplicate_index
+
+# 자주 쓰는 정규식은 모듈 로드 시 한 번만 컴파일
+_DATE_RE = re.compile(r'(\d{2,4})[-./](\d{1,2})[-./](\d{1,2})')
+# 날짜만 있는 텍스트 조각 (뒤에 시각이 붙어도 됨)
+_DATE_ONLY_RE = re.compile(r'\d{2,4}[-./]\d{1,2}[-./]\d{1,2}(\s+\d{1,2}:\d{2}(:\d{2})?)?')
+_INFO_DATE_RE = re.compile(r'(\d{2}-\d{2}-\d{2}\s+\d{2}:\d{2})')
+_LIST_NUMBER_RE = re.compile(r'^\d+\.')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+# 해시태그 (최대 10개, 그중 기사 키워드 태그 최대 3개)
+MAX_HASHTAGS = 10
+KEYWORD_HASHTAGS = 3
+BASE_HASHTAGS = ('#보스톤코리아', '#보스톤', '#Boston', '#미국뉴스')
+
+# 카테고리별 추가 태그 (위에서부터 처음 포함되는 카테고리 하나만 적용)
+CATEGORY_TAGS = {
+    '경제': ('#경제', '#비즈니스'),
+    '비즈니스': ('#비즈니스', '#경제뉴스'),
+    '미국주식': ('#미국주식', '#주식', '#투자'),
+    '스포츠': ('#스포츠', '#MLB', '#NBA'),
+    '한국': ('#한국뉴스', '#Korea'),
+    '교육': ('#교육', '#유학'),
+    '부동산': ('#부동산', '#미국부동산'),
+}
+
+# 인스타그램용 추가 해시태그
+INSTAGRAM_EXTRA_TAGS = '#뉴스 #미주한인 #재미교포 #한인커뮤니티 #보스톤한인'
+
+# 인스타그램 본문 요약 길이 (글자 수)
+INSTAGRAM_SUMMARY_LENGTH = 300
+
+# X 글자 수 제한과 t.co 단축 URL 길이
+X_MAX_LENGTH = 280
+X_URL_LENGTH = 23
+
+
+@lru_cache(maxsize=512)
+def _category_hashtags(category: str) -> tuple:
+    """카테고리 → 고정 해시태그 (카테고리 종류가 적으므로 결과를 캐시)"""
+    tags = list(BASE_HASHTAGS)
+    for key, extra_tags in CATEGORY_TAGS.items():
+        if key in category:
+            tags.extend(extra_tags)
+            break
+    return tuple(tags)
+
+
+def _parse_date(text: str):
+    """'2024-05-01', '24-05-01', '2024.05.01' 형식의 날짜를 date로 변환 (없으면 None)"""
+    match = _DATE_RE.search(text or '')
+    if not match:
+        return None
+    year, month, day = (int(g) for g in match.groups())
+    if year < 100:
+        year += 2000
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
 class BostonKoreaBot:
     BASE_URL = 'https://www.bostonkorea.com'
 
-    def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
-    def fetch_latest_articles(self, category: str = None, limit: int = 15) -> list:
-        """최신 기사 목록 가져오기"""
+    # 기사 본문 최대 길이 (글자 수)
+    CONTENT_LIMIT = 2000
+
+    # 메모리 캐시 유효 시간 (초). 목록은 자주 바뀌므로 짧게
+    LIST_TTL = 60
+    ARTICLE_TTL = 30 * 60
+
+    # fetch_article이 실제로 읽는 영역 (선택 파싱 시 이 영역만 트리로 생성)
+    ARTICLE_REGION_IDS = ('bo_v_title', 'bo_v_con', 'bo_v_img')
+    ARTICLE_REGION_CLASSES = ('bo_v_tit', 'bo_v_info', 'bo_v_cate', 'bo_tit')
+
+    def __init__(self, http=None, cache=None, parser=None, selective=True, keywords=None,
+                 dedup=None):
+        # 공유 keep-alive 세션 (목록 → 기사 클릭 시 연결 재사용)
+        self.http = http or get_client()
+        # ETag / Last-Modified 조건부 요청 캐시
+        self.cache = cache or get_http_cache()
+        # HTML 파서 백엔드 (selectolax / lxml / html.parser)
+        self.parser = parser or default_backend()
+        # 기사 페이지에서 필요한 영역만 파싱
+        self.selective = selective
+        # 파싱 결과 메모리 캐시 (같은 기사 재클릭, 카테고리 왕복 시 재요청 없음)
+        self.memory = TTLCache(maxsize=256, ttl=self.ARTICLE_TTL)
+        # 해시태그용 단어 통계 (가져온 기사마다 갱신)
+        # (빈 인덱스는 len()이 0이라 거짓이므로 None과 구분)
+        self.keywords = keywords if keywords is not None else get_keyword_index()
+        # 중복 기사 탐지 (여러 카테고리 / 제목만 고쳐 다시 올라온 기사)
+        self.dedup = dedup if dedup is not None else get_duplicate_index()
+
+    def _get_page(self, url: str):
+        """조건부 요청으로 페이지 가져오기 (304면 저장된 본문 사용)"""
+        return self.cache.fetch(self.http, url)
+
+    def _board_url(self, category: str = None, page: int = 1) -> str:
+        """게시판 목록 URL (page는 1부터)"""
+        url = f"{self.BASE_URL}/bbs/board.php?bo_table=news"
         if category:
-            url = f"{self.BASE_URL}/bbs/board.php?bo_table=news&sca={category}"
-        else:
-            url = f"{self.BASE_URL}/bbs/board.php?bo_table=news"
+            url += f"&sca={category}"
+        if page > 1:
+            url += f"&page={page}"
+        return url
+
+    def fetch_latest_articles(self, category: str = None, limit: int = 15,
+                              refresh: bool = False) -> list:
+        """최신 기사 목록 가져오기 (refresh면 메모리 캐시를 건너뛰고 서버에 재확인)"""
+        url = self._board_url(category)
+        memory_key = ('list', url, limit)
+        if not refresh:
+            cached = self.memory.get(memory_key)
+            if cached is not None:
+                # 캐시에는 중복 표시 전 목록이 저장되므로 돌려줄 때마다 다시 표시
+                self._annotate_duplicates(cached)
+                return cached
+
+        page = self._get_page(url)
+        parsed_key = f'list:{limit}'
+        articles = None
+        if page.not_modified:
+            articles = self.cache.load_parsed(url, parsed_key)
+        if articles is None:
+            articles = self.parse_article_list(page.content, limit, category)
+            if page.ok:
+                self.cache.store_parsed(url, parsed_key, articles)
+        if page.ok:
+            self.memory.set(memory_key, articles, ttl=self.LIST_TTL)
+        self._mark_duplicates(articles)
+        return articles
 
-        response = requests.get(url, headers=self.headers)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.text, 'html.parser')
+    def _mark_duplicates(self, articles: list):
+        """
+        목록 항목마다 먼저 본 비슷한 기사의 URL을 duplicate_of에 기록 (없으면 None).
+        목록은 최신순이므로 오래된 항목부터 등록해서 원본이 먼저 등록되게 함.
+        """
+        for item in reversed(articles):
+            self.dedup.add(item)
+        self._annotate_duplicates(articles)
+        # 목록 한 번에 한 번만 저장 (바뀐 항목만 기록)
+        self.dedup.flush()
+
+    def _annotate_duplicates(self, articles: list):
+        """이미 등록된 항목에 duplicate_of만 기록 (서명 계산 없음)."""
+        for item in articles:
+            item['duplicate_of'] = self.dedup.duplicate_of(item)
+
+    def parse_article_list(self, html: bytes, limit: int = 15, category: str = None) -> list:
+        """게시판 목록 HTML에서 기사 목록 추출"""
+        soup = parse_html(html, self.parser)
+        articles = self._extract_list_items(soup, limit)
 
+        # webzineList가 없으면 대체 방식
+        if not articles and not category:
+            links = soup.select('a[href*="/news/"]')
+            seen_urls = set()
+            for link in links:
+                href = link.get('href', '')
+                title_elem = link.select_one('strong') or link
+                title = title_elem.get_text(strip=True)
+
+                if '/news/' in href and href not in seen_urls and title and len(title) > 10:
+                    full_url = href if href.startswith('http') else self.BASE_URL + href
+                    seen_urls.add(href)
+                    articles.append({
+                        'title': title[:55] + '...' if len(title) > 55 else title,
+                        'url': full_url,
+                        'category': ''
+                    })
+                    if len(articles) >= limit:
+                        break
+
+        return articles
+
+    def _extract_list_items(self, soup, limit: int = None, with_date: bool = False) -> list:
+        """webzineList 항목에서 기사 추출 (with_date면 목록에 표시된 날짜도 포함)"""
         articles = []
 
         # webzineList 구조에서 기사 추출 (메인 콘텐츠 영역만)
@@ -59,7 +231,7 @@ class BostonKoreaBot:
                 title = tit_elem.get_text(strip=True) if tit_elem else ''
 
             # 제목 앞 숫자 제거 (예: "1.제목" → "제목")
-            title = re.sub(r'^\d+\.', '', title).strip()
+            title = _LIST_NUMBER_RE.sub('', title).strip()
 
             if not title or len(title) < 5:
                 continue
@@ -76,33 +248,92 @@ class BostonKoreaBot:
                 if len(em_text) < 20:
                     category_text = em_text
 
-            articles.append({
+            article = {
                 'title': title[:55] + '...' if len(title) > 55 else title,
                 'url': full_url,
                 'category': category_text
-            })
+            }
+            if with_date:
+                parsed_date = self._list_item_date(item)
+                article['date'] = parsed_date.isoformat() if parsed_date else ''
+            articles.append(article)
 
-        # webzineList가 없으면 대체 방식
-        if not articles and not category:
-            links = soup.select('a[href*="/news/"]')
-            seen_urls = set()
-            for link in links:
-                href = link.get('href', '')
-                title_elem = link.select_one('strong') or link
-                title = title_elem.get_text(strip=True)
+        return articles
 
-                if '/news/' in href and href not in seen_urls and title and len(title) > 10:
-                    full_url = href if href.startswith('http') else self.BASE_URL + href
-                    seen_urls.add(href)
-                    articles.append({
-                        'title': title[:55] + '...' if len(title) > 55 else title,
-                        'url': full_url,
-                        'category': ''
-                    })
-                    if len(articles) >= limit:
-                        break
+    @staticmethod
+    def _list_item_date(item):
+        """
+        목록 항목의 날짜. 날짜 칸이 없으면 제목 영역 밖에서 날짜만 있는 텍스트
+        조각을 찾음 (제목 속 '2024.05' 같은 숫자를 날짜로 읽지 않도록).
+        """
+        date_elem = item.select_one('.bo_date, .datetime, .date')
+        if date_elem:
+            return _parse_date(date_elem.get_text(strip=True))
+        tit_elem = item.select_one('.bo_tit')
+        title_pieces = set(tit_elem.stripped_strings) if tit_elem else set()
+        for piece in item.stripped_strings:
+            if piece not in title_pieces and _DATE_ONLY_RE.fullmatch(piece):
+                return _parse_date(piece)
+        return None
 
-        return articles
+    def iter_article_pages(self, category: str = None, start_page: int = 1):
+        """
+        게시판을 한 페이지씩 내려가며 (페이지 번호, 기사 목록) 반환.
+
+        필요할 때만 다음 페이지를 요청하므로 몇 페이지를 돌든 메모리는
+        한 페이지 분량만 사용합니다. 빈 페이지(또는 마지막 페이지가 반복되는
+        경우)에서 끝나고, 오류 응답이면 requests.HTTPError를 발생시킵니다.
+        """
+        page = start_page
+        previous_urls = None
+        while True:
+            response = self.http.get(self._board_url(category, page))
+            response.raise_for_status()
+            soup = parse_html(response.content, self.parser)
+            articles = self._extract_list_items(soup, with_date=True)
+            urls = [article['url'] for article in articles]
+            if not articles or urls == previous_urls:
+                return
+            yield page, articles
+            previous_urls = urls
+            page += 1
+
+    def iter_articles(self, category: str = None, since_url: str = None, since_date=None,
+                      start_page: int = 1):
+        """
+        최신 기사부터 과거로 하나씩 반환하는 lazy 제너레이터.
+
+        Args:
+            category: sca 값 (None이면 전체)
+            since_url: 이 URL(이미 알고 있는 기사)에 도달하면 중단
+            since_date: 이 날짜보다 오래된 기사에 도달하면 중단
+                (date/datetime 또는 'YYYY-MM-DD' / 'YY-MM-DD' 문자열)
+            start_page: 시작 페이지 번호
+        """
+        if isinstance(since_date, str):
+            since_date = _parse_date(since_date)
+        elif isinstance(since_date, datetime):
+            since_date = since_date.date()
+
+        # 크롤링 도중 새 기사가 올라오면 항목이 다음 페이지로 밀려 중복될 수 있음.
+        # 최근 URL만 기억해서 메모리 사용량을 일정하게 유지.
+        recent = deque(maxlen=100)
+        recent_set = set()
+
+        for _, articles in self.iter_article_pages(category, start_page):
+            for article in articles:
+                url = article['url']
+                if since_url and url == since_url:
+                    return
+                if since_date and article.get('date') and _parse_date(article['date']) < since_date:
+                    return
+                if url in recent_set:
+                    continue
+                if len(recent) == recent.maxlen:
+                    recent_set.discard(recent[0])
+                recent.append(url)
+                recent_set.add(url)
+                yield article
 
     def get_categories(self) -> dict:
         """사용 가능한 카테고리 목록"""
@@ -118,11 +349,63 @@ class BostonKoreaBot:
             '칼럼': '칼럼',
         }
 
-    def fetch_article(self, url: str) -> dict:
-        """기사 URL에서 정보 추출"""
-        response = requests.get(url, headers=self.headers)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.text, 'html.parser')
+    def crawl_all_categories(self, index=None, limit: int = 15):
+        """
+        모든 카테고리 목록을 동시에 가져와 URL 기준으로 병합.
+
+        같은 기사가 '전체'와 개별 카테고리에 함께 나오면 항목 하나에
+        categories 리스트로 모두 기록됩니다. 기존 index를 넘기면 바뀐
+        항목만 갱신합니다.
+
+        Returns:
+            (ArticleIndex, 바뀐 URL 집합) 튜플
+        """
+        return crawl_categories(self, index=index, limit=limit)
+
+    def fetch_article(self, url: str, refresh: bool = False) -> dict:
+        """기사 URL에서 정보 추출 (refresh면 메모리 캐시를 건너뛰고 서버에 재확인)"""
+        memory_key = ('article', url)
+        if not refresh:
+            cached = self.memory.get(memory_key)
+            if cached is not None:
+                return cached
+
+        page = self._get_page(url)
+        article = None
+        if page.not_modified:
+            article = self.cache.load_parsed(url, 'article')
+        if article is None:
+            article = self.parse_article(page.content, url)
+            if page.ok:
+                self.cache.store_parsed(url, 'article', article)
+        if page.ok:
+            self.memory.set(memory_key, article)
+            self.keywords.add(article)
+            self.dedup.add(article)
+        return article
+
+    def invalidate_cache(self, lists_only: bool = False):
+        """메모리 캐시 무효화 (lists_only면 기사 목록만)"""
+        if lists_only:
+            self.memory.invalidate(prefix='list')
+        else:
+            self.memory.invalidate()
+
+    def cache_stats(self) -> dict:
+        """메모리 캐시와 HTTP 캐시 통계 (디버그용)"""
+        return {
+            'memory': self.memory.stats(),
+            'http': self.cache.stats(),
+        }
+
+    def parse_article(self, html: bytes, url: str) -> dict:
+        """기사 HTML에서 정보 추출"""
+        if self.selective:
+            soup = parse_html(html, self.parser,
+                              only_ids=self.ARTICLE_REGION_IDS,
+                              only_classes=self.ARTICLE_REGION_CLASSES)
+        else:
+            soup = parse_html(html, self.parser)
 
         # 제목 추출
         title_elem = soup.select_one('#bo_v_title .bo_v_tit, h2.bo_v_tit')
@@ -132,11 +415,19 @@ class BostonKoreaBot:
         content_elem = soup.select_one('#bo_v_con')
         if content_elem:
             # 스크립트, 스타일 제거
-            for tag in content_elem.find_all(['script', 'style', 'iframe']):
+            for tag in content_elem.select('script, style, iframe'):
                 tag.decompose()
-            content = content_elem.get_text(separator='\n', strip=True)
+            # 본문 길이 제한에 도달하면 나머지 텍스트는 읽지 않음
+            pieces = []
+            length = 0
+            for piece in content_elem.stripped_strings:
+                pieces.append(piece)
+                length += len(piece) + 1
+                if length > self.CONTENT_LIMIT:
+                    break
+            content = '\n'.join(pieces)
             # 여러 줄바꿈을 하나로
-            content = re.sub(r'\n{3,}', '\n\n', content)
+            content = _BLANK_LINES_RE.sub('\n\n', content)
         else:
             content = ""
 
@@ -148,7 +439,7 @@ class BostonKoreaBot:
         date_elem = soup.select_one('.bo_v_info')
         date_text = ""
         if date_elem:
-            date_match = re.search(r'(\d{2}-\d{2}-\d{2}\s+\d{2}:\d{2})', date_elem.get_text())
+            date_match = _INFO_DATE_RE.search(date_elem.get_text())
             if date_match:
                 date_text = date_match.group(1)
 
@@ -161,71 +452,100 @@ class BostonKoreaBot:
         return {
             'url': url,
             'title': title,
-            'content': content[:2000],  # 처음 2000자만
+            'content': content[:self.CONTENT_LIMIT],
             'image_url': image_url,
             'date': date_text,
             'category': category
         }
 
-    def summarize_content(self, content: str, max_length: int = 200) -> str:
-        """본문 요약 (첫 문장들 추출)"""
-        sentences = re.split(r'[.。]\s*', content)
-        summary = ""
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-            if len(summary) + len(sentence) + 2 > max_length:
-                break
-            summary += sentence + ". "
-        return summary.strip()
-
-    def generate_hashtags(self, title: str, category: str) -> str:
-        """해시태그 생성"""
-        tags = ['#보스톤코리아', '#보스톤', '#Boston', '#미국뉴스']
-
-        # 카테고리별 태그 추가
-        category_tags = {
-            '경제': ['#경제', '#비즈니스'],
-            '비즈니스': ['#비즈니스', '#경제뉴스'],
-            '미국주식': ['#미국주식', '#주식', '#투자'],
-            '스포츠': ['#스포츠', '#MLB', '#NBA'],
-            '한국': ['#한국뉴스', '#Korea'],
-            '교육': ['#교육', '#유학'],
-            '부동산': ['#부동산', '#미국부동산'],
-        }
+    async def afetch_articles_bulk(self, urls, concurrency: int = 8, per_host: int = 4):
+        """
+        여러 기사를 동시에 가져오기 (async iterator).
+
+        완료되는 순서대로 (url, article, error) 튜플을 돌려줍니다.
+        성공하면 error가 None, 실패하면 article이 None입니다.
+
+        Args:
+            urls: 기사 URL 목록 (중복은 한 번만 요청)
+            concurrency: 전체 동시 요청 수
+            per_host: 호스트별 동시 요청 상한
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        host_slots = {}
+
+        async def fetch_one(url):
+            host = urlsplit(url).hostname or ''
+            slot = host_slots.setdefault(host, asyncio.Semaphore(per_host))
+            async with slot:
+                try:
+                    article = await loop.run_in_executor(executor, self.fetch_article, url)
+                    return url, article, None
+                except Exception as e:
+                    return url, None, e
+
+        tasks = [asyncio.ensure_future(fetch_one(url)) for url in dict.fromkeys(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False)
+
+    def fetch_articles_bulk(self, urls, concurrency: int = 8, per_host: int = 4) -> list:
+        """afetch_articles_bulk의 동기 버전 (완료 순서의 (url, article, error) 리스트)"""
+        async def collect():
+            return [result async for result in
+                    self.afetch_articles_bulk(urls, concurrency, per_host)]
+        return asyncio.run(collect())
 
-        for key, extra_tags in category_tags.items():
-            if key in category:
-                tags.extend(extra_tags)
+    def summarize_content(self, content: str, max_length: int = 200) -> str:
+        """본문 요약 (TextRank 추출 요약, 사진 설명/바이라인 제외)"""
+        return summarize(content, max_length)
+
+    def generate_hashtags(self, title: str, category: str, content: str = '',
+                          url: str = None) -> str:
+        """해시태그 생성 (고정 태그 + 카테고리 태그 + 기사 키워드 태그)"""
+        fixed = _category_hashtags(category or '')
+        tags = list(fixed)
+        limit = min(MAX_HASHTAGS, len(fixed) + KEYWORD_HASHTAGS)
+        article = {'url': url, 'title': title, 'content': content}
+        # 고정 태그와 겹치는 키워드가 있을 수 있으므로 넉넉히 받아서 채움
+        for tag in self.keywords.hashtags(article, limit):
+            if len(tags) >= limit:
                 break
+            if tag not in tags:
+                tags.append(tag)
+        return ' '.join(tags)
 
-        return ' '.join(tags[:8])  # 최대 8개
+    def _article_hashtags(self, article: dict) -> str:
+        return self.generate_hashtags(article['title'], article['category'],
+                                      article.get('content', ''), article.get('url'))
 
-    def format_for_x(self, article: dict) -> str:
+    def format_for_x(self, article: dict, hashtags: str = None) -> str:
         """X(트위터)용 포맷 생성 (280자 제한)"""
         title = article['title']
         url = article['url']
-        hashtags = self.generate_hashtags(title, article['category'])
+        if hashtags is None:
+            hashtags = self._article_hashtags(article)
 
-        # URL은 약 23자로 계산 (t.co 단축)
-        url_length = 23
-        hashtag_length = len(hashtags)
-        available = 280 - url_length - hashtag_length - 4  # 여유 공간
+        # URL은 t.co 단축 길이로 계산
+        available = X_MAX_LENGTH - X_URL_LENGTH - len(hashtags) - 4  # 여유 공간
 
         if len(title) > available:
             title = title[:available-3] + "..."
 
         return f"{title}\n\n{url}\n\n{hashtags}"
 
-    def format_for_instagram(self, article: dict) -> str:
+    def format_for_instagram(self, article: dict, hashtags: str = None,
+                             summary: str = None) -> str:
         """인스타그램용 포맷 생성"""
         title = article['title']
-        summary = self.summarize_content(article['content'], 300)
-        hashtags = self.generate_hashtags(title, article['category'])
-
-        # 인스타그램용 추가 해시태그
-        extra_tags = '#뉴스 #미주한인 #재미교포 #한인커뮤니티 #보스톤한인'
+        if summary is None:
+            summary = self.summarize_content(article['content'], INSTAGRAM_SUMMARY_LENGTH)
+        if hashtags is None:
+            hashtags = self._article_hashtags(article)
 
         post = f"""📰 {title}
 
@@ -234,23 +554,50 @@ class BostonKoreaBot:
 👉 자세한 내용은 프로필 링크에서 확인하세요!
 
 {hashtags}
-{extra_tags}"""
+{INSTAGRAM_EXTRA_TAGS}"""
 
         return post
 
-    def format_for_both(self, article: dict) -> dict:
+    def format_for_both(self, article: dict, summary: str = None) -> dict:
         """두 플랫폼용 포맷 모두 생성"""
+        # 해시태그는 한 번만 만들어 두 포맷이 같이 사용
+        hashtags = self._article_hashtags(article)
         return {
-            'x': self.format_for_x(article),
-            'instagram': self.format_for_instagram(article),
+            'x': self.format_for_x(article, hashtags),
+            'instagram': self.format_for_instagram(article, hashtags, summary),
             'image_url': article.get('image_url', '')
         }
 
-
-def process_article(bot, url):
+    def format_many(self, articles, batch_size: int = 64):
+        """
+        여러 기사를 한꺼번에 포맷 (재홍보용 대량 처리).
+
+        Args:
+            articles: 기사 dict의 iterable (리스트, 제너레이터, ArticleStore 결과 등)
+            batch_size: 요약을 한 번에 계산할 기사 수
+
+        Yields:
+            (article, format_for_both 결과) - 입력 순서대로 batch_size개씩 생성하므로
+            전체를 메모리에 올리지 않고 바로 저장/전송할 수 있음
+        """
+        format_both = self.format_for_both
+        articles = iter(articles)
+        while True:
+            batch = list(islice(articles, batch_size))
+            if not batch:
+                return
+            summaries = summarize_many([article['content'] for article in batch],
+                                       INSTAGRAM_SUMMARY_LENGTH)
+            for article, summary in zip(batch, summaries):
+                yield article, format_both(article, summary)
+
+
+def process_article(bot, url, store=None):
     """기사 처리 및 출력"""
     print("\n⏳ 기사를 가져오는 중...")
     article = bot.fetch_article(url)
+    if store is not None:
+        store.upsert(article)
     result = bot.format_for_both(article)
 
     print("\n" + "=" * 50)
@@ -330,7 +677,8 @@ def show_article_list(bot):
 
     for i, article in enumerate(articles, 1):
         cat_tag = f"[{article['category']}] " if article['category'] else ""
-        print(f"{i:2}. {cat_tag}{article['title']}")
+        dup_tag = " (중복)" if article.get('duplicate_of') else ""
+        print(f"{i:2}. {cat_tag}{article['title']}{dup_tag}")
 
     print("\n0. 메인 메뉴로 돌아가기")
 
@@ -349,8 +697,45 @@ def show_article_list(bot):
     return None
 
 
+def search_stored_articles(store, dedup):
+    """저장된 기사 검색 및 선택 (먼저 본 비슷한 기사가 있으면 '(중복)' 표시)"""
+    print(f"\n💾 저장된 기사: {store.count()}개")
+    query = input("검색어 (빈 값이면 최근 기사): ").strip()
+
+    results = store.search(query, limit=15)
+    if not results:
+        print("❌ 검색 결과가 없습니다.")
+        return None
+
+    print("\n" + "=" * 50)
+    print(f"🔍 검색 결과 ({len(results)}개)")
+    print("=" * 50)
+
+    for i, article in enumerate(results, 1):
+        cat_tag = f"[{article['category']}] " if article['category'] else ""
+        dup_tag = " (중복)" if dedup.duplicate_of(article) else ""
+        print(f"{i:2}. {cat_tag}{article['title']}{dup_tag}")
+
+    print("\n0. 메인 메뉴로 돌아가기")
+
+    article_choice = input("\n기사 번호 선택: ").strip()
+
+    try:
+        idx = int(article_choice)
+        if idx == 0:
+            return None
+        if 1 <= idx <= len(results):
+            return results[idx - 1]['url']
+    except:
+        pass
+
+    print("❌ 잘못된 선택입니다.")
+    return None
+
+
 def main():
     bot = BostonKoreaBot()
+    store = ArticleStore()
 
     print("=" * 50)
     print("🗞️  보스톤코리아 소셜미디어 포스팅 봇")
@@ -360,19 +745,23 @@ def main():
         print("\n옵션을 선택하세요:")
         print("1. 최신 기사 목록 보기")
         print("2. 기사 URL 직접 입력")
-        print("3. 종료")
+        print("3. 저장된 기사 검색")
+        print("4. 종료")
 
-        choice = input("\n선택 (1-3): ").strip()
+        choice = input("\n선택 (1-4): ").strip()
 
-        if choice == '3':
+        if choice == '4':
             print("👋 종료합니다.")
             break
 
-        if choice == '1':
-            url = show_article_list(bot)
+        if choice in ('1', '3'):
+            if choice == '1':
+                url = show_article_list(bot)
+            else:
+                url = search_stored_articles(store, bot.dedup)
             if url:
                 try:
-                    process_article(bot, url)
+                    process_article(bot, url, store)
                 except Exception as e:
                     print(f"❌ 오류 발생: {e}")
             continue
@@ -388,7 +777,7 @@ def main():
             continue
 
         try:
-            process_article(bot, url)
+            process_article(bot, url, store)
         except Exception as e:
             print(f"❌ 오류 발생: {e}")
             continue
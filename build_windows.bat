@@ -21,6 +21,17 @@ pyinstaller --noconfirm --onefile --windowed ^
     --add-data "config_manager.py;." ^
     --add-data "social_poster.py;." ^
     --add-data "media_generator.py;." ^
+    --add-data "http_client.py;." ^
+    --add-data "rate_limiter.py;." ^
+    --add-data "http_cache.py;." ^
+    --add-data "html_parser.py;." ^
+    --add-data "crawler.py;." ^
+    --add-data "article_store.py;." ^
+    --add-data "memory_cache.py;." ^
+    --add-data "summarizer.py;." ^
+    --add-data "hashtags.py;." ^
+    --add-data "dedup.py;." ^
+    --add-data "image_cache.py;." ^
     --hidden-import customtkinter ^
     --hidden-import tweepy ^
     --hidden-import instagrapi ^
@@ -15,6 +15,21 @@ else:
 
 CONFIG_FILE = os.path.join(_APP_DIR, "config.json")
 
+# HTTP/이미지 캐시 등 재생성 가능한 파일 저장 디렉토리
+CACHE_DIR = os.path.join(_APP_DIR, "cache")
+
+# 가져온 기사 저장소 (SQLite)
+ARTICLE_DB = os.path.join(_APP_DIR, "articles.db")
+
+# 새 기사 감시기가 이미 본 URL 목록
+WATCHER_STATE = os.path.join(_APP_DIR, "watcher_state.json")
+
+# 해시태그용 단어 통계 (기사가 들어올 때마다 갱신, 지워도 다시 쌓임)
+KEYWORD_INDEX = os.path.join(CACHE_DIR, "keywords.json")
+
+# 중복 기사 탐지용 서명과 게시 기록
+DEDUP_INDEX = os.path.join(_APP_DIR, "dedup_index.db")
+
 DEFAULT_CONFIG = {
     "x": {
         "api_key": "",
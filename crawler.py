@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+크롤러 모듈
+- ArticleIndex: URL 기준으로 병합된 기사 색인 (기사마다 등장한 카테고리 전부 기록)
+- crawl_categories(): 모든 카테고리 목록을 동시에 가져와 색인에 병합
+- backfill(): 체크포인트 파일로 재개 가능한 과거 기사 대량 수집
+- archive_articles(): 기사 본문을 동시에 가져와 ArticleStore에 일괄 저장
+- render_cards(): 기사 본문을 동시에 가져와 카드 이미지를 프로세스 풀에서 일괄 생성
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+_log = logging.getLogger(__name__)
+
+# backfill이 중복 확인용으로 기억하는 최근 URL 수 (몇 페이지 분량)
+BACKFILL_RECENT = 100
+
+
+class ArticleIndex:
+    """URL → 기사 항목 색인. 여러 스레드에서 공유 가능."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def merge(self, category_name, articles) -> set:
+        """
+        한 카테고리의 목록 결과를 병합.
+
+        Returns:
+            새로 추가되었거나 내용(제목/카테고리)이 바뀐 URL 집합
+        """
+        changed = set()
+        with self._lock:
+            for article in articles:
+                url = article['url']
+                entry = self._entries.get(url)
+                if entry is None:
+                    entry = dict(article)
+                    entry['categories'] = [category_name]
+                    self._entries[url] = entry
+                    changed.add(url)
+                    continue
+
+                if category_name not in entry['categories']:
+                    entry['categories'].append(category_name)
+                    changed.add(url)
+                if entry['title'] != article['title']:
+                    entry['title'] = article['title']
+                    changed.add(url)
+                # '전체' 목록의 em 카테고리가 비어 있을 수 있으므로 빈 값으로 덮어쓰지 않음
+                if article.get('category') and entry.get('category') != article['category']:
+                    entry['category'] = article['category']
+                    changed.add(url)
+        return changed
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry, categories=list(entry['categories'])) if entry else None
+
+    def entries(self, category_name=None) -> list:
+        """색인 항목 목록 (category_name을 주면 해당 카테고리에 등장한 것만)."""
+        with self._lock:
+            return [
+                dict(entry, categories=list(entry['categories']))
+                for entry in self._entries.values()
+                if category_name is None or category_name in entry['categories']
+            ]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, url):
+        return url in self._entries
+
+
+def crawl_categories(bot, index=None, categories=None, limit=15, workers=None):
+    """
+    여러 카테고리 목록을 동시에 가져와 하나의 색인으로 병합.
+    가져오기에 실패한 카테고리는 경고 로그만 남기고 건너뜀 (나머지는 그대로 병합).
+
+    Args:
+        bot: BostonKoreaBot 인스턴스
+        index: 갱신할 ArticleIndex (None이면 새로 생성)
+        categories: {표시 이름: sca 값} (None이면 bot.get_categories() 전체)
+        limit: 카테고리별 기사 수
+        workers: 동시 요청 수 (None이면 카테고리 수)
+
+    Returns:
+        (index, 바뀐 URL 집합) 튜플
+    """
+    index = index if index is not None else ArticleIndex()
+    categories = categories or bot.get_categories()
+
+    with ThreadPoolExecutor(max_workers=workers or len(categories)) as pool:
+        futures = {
+            name: pool.submit(bot.fetch_latest_articles, category=sca, limit=limit)
+            for name, sca in categories.items()
+        }
+        # 결과 순서가 항상 같도록 카테고리 순서대로 병합
+        changed = set()
+        for name, future in futures.items():
+            try:
+                articles = future.result()
+            except Exception as e:
+                _log.warning("카테고리 '%s' 목록 가져오기 실패: %s", name, e)
+                continue
+            changed |= index.merge(name, articles)
+
+    return index, changed
+
+
+def _load_checkpoint(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _save_checkpoint(path, state):
+    """중간에 끊겨도 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def backfill(bot, checkpoint_path, on_article, category=None, since_date=None, max_pages=None):
+    """
+    과거 기사 대량 수집. 페이지마다 체크포인트 파일을 갱신하므로 중단(또는
+    요청 오류로 예외 발생)되어도 같은 checkpoint_path로 다시 호출하면 마지막으로
+    끝난 다음 페이지부터 이어서 진행.
+
+    Args:
+        bot: BostonKoreaBot 인스턴스
+        checkpoint_path: 진행 상황 JSON 파일 경로
+        on_article: 기사마다 호출되는 콜백 (article dict)
+        category: sca 값 (None이면 전체)
+        since_date: 이 날짜보다 오래된 기사에 도달하면 완료 처리
+            (date/datetime 또는 'YYYY-MM-DD' / 'YY-MM-DD' 문자열)
+        max_pages: 이번 실행에서 처리할 최대 페이지 수
+
+    Returns:
+        체크포인트 상태 dict (next_page, count, done, recent)
+    """
+    from bostonkorea_bot import _parse_date
+
+    state = _load_checkpoint(checkpoint_path)
+    if not state or state.get("category") != (category or ""):
+        state = {"category": category or "", "next_page": 1, "count": 0, "done": False}
+    if state["done"]:
+        return state
+
+    if isinstance(since_date, str):
+        since_date = _parse_date(since_date)
+    elif isinstance(since_date, datetime):
+        since_date = since_date.date()
+
+    # 수집 도중 새 기사가 올라오면 앞 페이지 항목이 다음 페이지로 밀려 다시 나옴.
+    # 최근 URL을 체크포인트에 함께 저장해서 재개 후에도 건너뜀.
+    recent = deque(state.get("recent", []), maxlen=BACKFILL_RECENT)
+    recent_set = set(recent)
+
+    pages_done = 0
+    for page, articles in bot.iter_article_pages(category, start_page=state["next_page"]):
+        for article in articles:
+            article_date = _parse_date(article.get("date"))
+            if since_date and article_date and article_date < since_date:
+                state["done"] = True
+                break
+            if article["url"] in recent_set:
+                continue
+            if len(recent) == recent.maxlen:
+                recent_set.discard(recent[0])
+            recent.append(article["url"])
+            recent_set.add(article["url"])
+            on_article(article)
+            state["count"] += 1
+        state["next_page"] = page + 1
+        state["recent"] = list(recent)
+        _save_checkpoint(checkpoint_path, state)
+        pages_done += 1
+        if state["done"] or (max_pages and pages_done >= max_pages):
+            return state
+
+    # 빈 페이지까지 내려가서 게시판 끝에 도달
+    state["done"] = True
+    _save_checkpoint(checkpoint_path, state)
+    return state
+
+
+def archive_articles(bot, store, urls, concurrency=8, batch_size=50) -> int:
+    """
+    기사 본문을 동시에 가져와 ArticleStore에 묶음 단위로 저장.
+
+    Returns:
+        저장한 기사 수 (가져오기에 실패한 URL은 건너뜀)
+    """
+    saved = 0
+    batch = []
+    for _, article, error in bot.fetch_articles_bulk(urls, concurrency=concurrency):
+        if error is not None:
+            continue
+        batch.append(article)
+        if len(batch) >= batch_size:
+            saved += store.upsert_many(batch)
+            batch = []
+    if batch:
+        saved += store.upsert_many(batch)
+    return saved
+
+
+def render_cards(bot, urls, output_dir, workers=None, concurrency=8):
+    """
+    기사 본문(이미지 URL)을 동시에 가져온 뒤 카드를 CardGenerator.generate_many로 일괄 생성.
+    전체 카테고리 색인의 기사 전부를 한 번에 처리할 때 사용
+    (예: render_cards(bot, [e['url'] for e in index.entries()], "cards")).
+
+    Yields:
+        (url, 카드 경로, error) - 끝난 순서대로. 본문 가져오기나 생성에 실패하면 경로가 None
+    """
+    from media_generator import CardGenerator
+
+    articles = []
+    for url, article, error in bot.fetch_articles_bulk(urls, concurrency=concurrency):
+        if error is not None:
+            yield url, None, error
+            continue
+        articles.append(article)
+
+    for article, path, error in CardGenerator().generate_many(
+            articles, workers=workers, output_dir=output_dir, concurrency=concurrency):
+        yield article['url'], path, error
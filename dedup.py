@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+중복 기사 탐지 모듈 - 여러 카테고리에 올라오거나 제목만 살짝 고쳐 다시 올라온 기사 찾기
+- MinHash 서명: 공백/문장부호를 뺀 글자 k-gram(shingle)의 최소 해시 128개
+- LSH 밴딩: 서명을 32개 밴드로 나눠 밴드별 버킷에 등록 → 조회는 버킷 32번 확인으로 끝나므로
+  저장된 기사 수와 상관없이 일정한 시간
+- 본문이 있으면 본문 서명으로, 목록처럼 제목만 있으면 제목으로 비교.
+  제목은 짧아서 추정 오차가 크므로 후보를 실제 자카드 유사도와 숫자 일치로 다시 확인
+- DuplicateIndex: 서명(바이너리)과 게시 기록을 SQLite에 저장. 바뀐 기사만 기록하고
+  목록 한 번 처리가 끝날 때(또는 종료 시) 한 번에 저장
+- get_duplicate_index(): 프로세스 전역 공유 인덱스
+"""
+
+import atexit
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from config_manager import DEDUP_INDEX
+
+NUM_PERM = 128
+BANDS = 32
+# shingle 길이 (제목은 짧으므로 짧게)
+BODY_SHINGLE = 5
+TITLE_SHINGLE = 2
+# 이 값 이상이면 중복으로 판정 (본문: 추정 자카드 유사도, 제목: 실제 자카드 유사도)
+BODY_THRESHOLD = 0.7
+TITLE_THRESHOLD = 0.8
+# 목록 제목은 55자에서 잘리므로 제목은 앞 55자만 비교 (목록 항목과 기사 본문 제목을 같은 기준으로)
+TITLE_CHARS = 55
+# 기억할 최대 기사 수 (넘치면 오래된 것부터 삭제)
+MAX_DOCS = 20000
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+_TRUNCATED_RE = re.compile(r'(\.\.\.|…)$')
+_NUMBER_RE = re.compile(r'\d+')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    url       TEXT PRIMARY KEY,
+    seq       INTEGER NOT NULL,
+    title     TEXT NOT NULL DEFAULT '',
+    title_sig BLOB,
+    body_sig  BLOB,
+    posted    TEXT NOT NULL DEFAULT ''
+);
+"""
+
+_UPSERT = """
+INSERT OR REPLACE INTO docs (url, seq, title, title_sig, body_sig, posted)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# 고정 시드의 해시 계수 (저장된 서명과 호환되도록 바꾸지 말 것)
+_rng = np.random.default_rng(20240501)
+_A = _rng.integers(1, 2 ** 63, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2 ** 63, size=NUM_PERM, dtype=np.uint64)
+_BASE = np.uint64(1_000_003)
+
+
+def _shingle_codes(text: str, k: int) -> np.ndarray:
+    """정규화한 텍스트의 글자 k-gram을 64비트 다항식 해시로 (중복 제거)."""
+    text = _NON_WORD_RE.sub('', (text or '').lower())
+    if len(text) < k:
+        return np.empty(0, dtype=np.uint64)
+    chars = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    count = len(chars) - k + 1
+    codes = chars[:count].copy()
+    for j in range(1, k):
+        codes = codes * _BASE + chars[j:j + count]
+    return np.unique(codes)
+
+
+def _title_key(title: str) -> str:
+    """비교용 제목 (목록의 말줄임표를 떼고 앞 TITLE_CHARS자)."""
+    return _TRUNCATED_RE.sub('', (title or '').strip())[:TITLE_CHARS]
+
+
+def _jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """정렬된 shingle 코드 집합의 실제 자카드 유사도."""
+    if len(a) == 0 or len(b) == 0:
+        return 0.0
+    common = len(np.intersect1d(a, b, assume_unique=True))
+    return common / (len(a) + len(b) - common)
+
+
+def _same_title(a: str, b: str) -> bool:
+    """
+    두 제목이 같은 기사인지 (2-gram 자카드 TITLE_THRESHOLD 이상이고 숫자가 모두 같음).
+    연재 번호, 날짜, 금액만 다른 제목은 다른 기사로 봄.
+    """
+    if _NUMBER_RE.findall(a) != _NUMBER_RE.findall(b):
+        return False
+    return _jaccard(_shingle_codes(a, TITLE_SHINGLE),
+                    _shingle_codes(b, TITLE_SHINGLE)) >= TITLE_THRESHOLD
+
+
+def minhash(text: str, k: int) -> np.ndarray:
+    """MinHash 서명 (uint32 NUM_PERM개). shingle이 없으면 None."""
+    codes = _shingle_codes(text, k)
+    if len(codes) == 0:
+        return None
+    # multiply-shift 해시: (a * x + b) mod 2^64 의 상위 32비트
+    with np.errstate(over='ignore'):
+        hashed = (_A[:, None] * codes[None, :] + _B[:, None]) >> np.uint64(32)
+    return hashed.min(axis=1).astype(np.uint32)
+
+
+class _LSHTable:
+    """서명 → 후보 URL 버킷 (밴드별 해시 테이블)"""
+
+    def __init__(self, bands=BANDS):
+        self.bands = bands
+        self._buckets = {}
+
+    def _keys(self, signature):
+        rows = len(signature) // self.bands
+        return [(band, signature[band * rows:(band + 1) * rows].tobytes())
+                for band in range(self.bands)]
+
+    def add(self, url, signature):
+        for key in self._keys(signature):
+            self._buckets.setdefault(key, set()).add(url)
+
+    def remove(self, url, signature):
+        for key in self._keys(signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(url)
+                if not bucket:
+                    del self._buckets[key]
+
+    def candidates(self, signature) -> set:
+        found = set()
+        for key in self._keys(signature):
+            found |= self._buckets.get(key, set())
+        return found
+
+
+class DuplicateIndex:
+    """기사 중복 인덱스 (MinHash + LSH, SQLite 저장)"""
+
+    def __init__(self, path=DEDUP_INDEX, max_docs=MAX_DOCS):
+        self.path = path
+        self.max_docs = max_docs
+        # url -> {'title': 비교용 제목, 'title_sig': 서명, 'body_sig': 서명 또는 None,
+        #         'posted': 플랫폼 집합, 'seq': 등록 순번}
+        self._docs = OrderedDict()
+        self._seq = 0
+        self._titles = _LSHTable()
+        self._bodies = _LSHTable()
+        # 아직 저장하지 않은 변경 (갱신된 URL, 삭제된 URL)
+        self._dirty = set()
+        self._removed = set()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+        self._load()
+
+    # ===== 저장 =====
+
+    def _load(self):
+        if self._conn is None:
+            return
+        rows = self._conn.execute(
+            "SELECT url, seq, title, title_sig, body_sig, posted FROM docs "
+            "ORDER BY seq DESC LIMIT ?", (self.max_docs,)).fetchall()
+        for url, seq, title, title_sig, body_sig, posted in reversed(rows):
+            self._seq = max(self._seq, seq + 1)
+            self._insert(url, title, self._decode(title_sig), self._decode(body_sig),
+                         set(filter(None, posted.split(','))), seq=seq)
+        self._dirty.clear()
+        self._removed.clear()
+
+    @staticmethod
+    def _decode(value):
+        return np.frombuffer(value, dtype=np.uint32) if value else None
+
+    @staticmethod
+    def _encode(signature):
+        return signature.tobytes() if signature is not None else None
+
+    def save(self):
+        """바뀐 기사만 저장 (한 트랜잭션)."""
+        if self._conn is None:
+            return
+        with self._lock:
+            rows = []
+            for url in self._dirty:
+                doc = self._docs.get(url)
+                if doc is not None:
+                    rows.append((url, doc['seq'], doc['title'], self._encode(doc['title_sig']),
+                                 self._encode(doc['body_sig']), ','.join(sorted(doc['posted']))))
+            removed = [(url,) for url in self._removed if url not in self._docs]
+            self._dirty.clear()
+            self._removed.clear()
+            with self._conn:
+                if rows:
+                    self._conn.executemany(_UPSERT, rows)
+                if removed:
+                    self._conn.executemany("DELETE FROM docs WHERE url = ?", removed)
+
+    def flush(self):
+        """저장하지 않은 변경이 있을 때만 저장."""
+        if self._dirty or self._removed:
+            self.save()
+
+    # ===== 등록 =====
+
+    def _insert(self, url, title, title_sig, body_sig, posted, seq=None):
+        """잠금을 잡은 상태에서 호출."""
+        old = self._docs.get(url)
+        if old is not None:
+            self._unindex(url, old)
+            seq = old['seq']
+        elif seq is None:
+            seq = self._seq
+            self._seq += 1
+        # 이미 있던 URL이면 등록 순서(canonical 판정 기준)는 그대로 유지
+        self._docs[url] = {'title': title, 'title_sig': title_sig, 'body_sig': body_sig,
+                           'posted': posted, 'seq': seq}
+        self._dirty.add(url)
+        if title_sig is not None:
+            self._titles.add(url, title_sig)
+        if body_sig is not None:
+            self._bodies.add(url, body_sig)
+        while len(self._docs) > self.max_docs:
+            old_url, old_doc = self._docs.popitem(last=False)
+            self._unindex(old_url, old_doc)
+            self._dirty.discard(old_url)
+            self._removed.add(old_url)
+
+    def _unindex(self, url, doc):
+        if doc['title_sig'] is not None:
+            self._titles.remove(url, doc['title_sig'])
+        if doc['body_sig'] is not None:
+            self._bodies.remove(url, doc['body_sig'])
+
+    @staticmethod
+    def _signatures(article: dict):
+        """(비교용 제목, 제목 서명, 본문 서명)"""
+        title = _title_key(article.get('title', ''))
+        return (title, minhash(title, TITLE_SHINGLE),
+                minhash(article.get('content', ''), BODY_SHINGLE))
+
+    def add(self, article: dict):
+        """
+        기사 등록 (같은 URL이면 갱신, 본문이 새로 생기면 본문 서명 추가).
+        파일에는 save()/flush() 때 기록됩니다.
+        """
+        url = article['url']
+        title, title_sig, body_sig = self._signatures(article)
+        with self._lock:
+            old = self._docs.get(url)
+            if old is not None:
+                if body_sig is None or old['body_sig'] is not None:
+                    return
+                posted = old['posted']
+            else:
+                posted = set()
+            self._insert(url, title, title_sig, body_sig, posted)
+
+    # ===== 조회 =====
+
+    def _matches(self, article: dict, title, title_sig=None, body_sig=None) -> list:
+        """(유사도, url) 목록 (자기 자신 제외, 유사도 높은 순). 잠금을 잡은 상태에서 호출."""
+        url = article.get('url')
+        if body_sig is not None:
+            table, kind, signature, threshold = self._bodies, 'body_sig', body_sig, BODY_THRESHOLD
+        elif title_sig is not None:
+            # 제목 서명은 후보를 찾는 데만 쓰고 판정은 _same_title로 다시 확인
+            table, kind, signature, threshold = self._titles, 'title_sig', title_sig, 0.0
+        else:
+            return []
+        candidates = [other for other in table.candidates(signature) if other != url]
+        if not candidates:
+            return []
+        # 후보 서명을 모아 한 번에 비교
+        stacked = np.stack([self._docs[other][kind] for other in candidates])
+        scores = (stacked == signature).mean(axis=1)
+        found = [(float(score), other) for score, other in zip(scores, candidates)
+                 if score >= threshold]
+        if kind == 'title_sig':
+            found = [(score, other) for score, other in found
+                     if _same_title(title, self._docs[other]['title'])]
+        found.sort(key=lambda item: -item[0])
+        return found
+
+    def find(self, article: dict) -> list:
+        """
+        article과 비슷한 등록된 기사 URL 목록 (유사도 높은 순, 자기 자신 제외).
+        본문이 있으면 본문으로, 없으면 제목으로 비교합니다.
+        """
+        title, title_sig, body_sig = self._signatures(article)
+        with self._lock:
+            return [url for _, url in self._matches(article, title, title_sig, body_sig)]
+
+    def canonical(self, article: dict) -> str:
+        """비슷한 기사 중 가장 먼저 등록된 것의 URL (없으면 자기 URL)."""
+        url = article['url']
+        matches = self.find(article)
+        with self._lock:
+            seqs = {other: self._docs[other]['seq'] for other in matches if other in self._docs}
+            if url in self._docs:
+                seqs[url] = self._docs[url]['seq']
+        if not seqs:
+            return url
+        return min(seqs, key=seqs.get)
+
+    def duplicate_of(self, article: dict):
+        """article보다 먼저 등록된 비슷한 기사의 URL (없으면 None)."""
+        first = self.canonical(article)
+        return None if first == article['url'] else first
+
+    def posted_duplicate(self, article: dict, platform: str):
+        """article(또는 비슷한 기사)이 이미 platform에 게시됐으면 그 URL, 아니면 None."""
+        with self._lock:
+            own = self._docs.get(article['url'])
+            if own is not None and platform in own['posted']:
+                return article['url']
+        for url in self.find(article):
+            with self._lock:
+                doc = self._docs.get(url)
+                if doc is not None and platform in doc['posted']:
+                    return url
+        return None
+
+    def mark_posted(self, article: dict, platform: str):
+        """게시 기록 (다음 posted_duplicate 조회부터 반영)."""
+        self.add(article)
+        with self._lock:
+            doc = self._docs.get(article['url'])
+            if doc is not None:
+                doc['posted'].add(platform)
+                self._dirty.add(article['url'])
+        self.save()
+
+    def __len__(self):
+        return len(self._docs)
+
+
+_default_index = None
+_default_lock = threading.Lock()
+
+
+def get_duplicate_index() -> DuplicateIndex:
+    """프로세스 전역 공유 DuplicateIndex 반환."""
+    global _default_index
+    if _default_index is None:
+        with _default_lock:
+            if _default_index is None:
+                _default_index = DuplicateIndex()
+                atexit.register(_default_index.flush)
+    return _default_index
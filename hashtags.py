@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+해시태그 키워드 모듈 - 지금까지 가져온 기사 전체의 단어 통계로 기사별 해시태그 선택
+- tokenize(): 한글 단어(조사/어미 제거)와 영문 단어 추출
+- KeywordIndex: 단어별 문서 빈도(df)를 기사가 들어올 때마다 갱신하고 JSON 파일에 저장.
+  기사 하나의 키워드 계산은 그 기사의 단어 수에만 비례 (말뭉치 크기와 무관)
+- get_keyword_index(): 프로세스 전역 공유 인덱스
+"""
+
+import atexit
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter, OrderedDict
+
+from config_manager import KEYWORD_INDEX
+
+_HANGUL_RE = re.compile(r'[가-힣]{2,}')
+_ENGLISH_RE = re.compile(r'[A-Za-z][A-Za-z0-9&]{1,}')
+# X/인스타그램 해시태그는 이 문자에서 끝나므로 태그에서 제거 (AT&T → #ATT)
+_HASHTAG_INVALID_RE = re.compile(r'[^0-9A-Za-z가-힣_]')
+
+# 단어 끝에서 떼어낼 조사 (긴 것부터 비교)
+_PARTICLES = sorted((
+    '은', '는', '이', '가', '을', '를', '의', '에', '에서', '에게', '께서', '으로', '로',
+    '와', '과', '도', '만', '까지', '부터', '보다', '처럼', '이나', '나', '라고', '이라고',
+    '에는', '에서는', '으로는', '로는', '과의', '와의', '에도', '에서도', '이며', '이고',
+    '들', '들은', '들이', '들을', '들의', '들에게',
+), key=len, reverse=True)
+
+# 이 어미로 끝나는 단어는 서술어로 보고 제외
+_PREDICATE_ENDINGS = (
+    '했다', '한다', '된다', '됐다', '였다', '있다', '없다', '이다', '했고', '하고',
+    '하는', '하며', '했으며', '밝혔다', '전했다', '말했다', '됩니다', '합니다', '습니다',
+)
+
+STOPWORDS = frozenset((
+    # 기사 상투어
+    '기자', '보스톤코리아', '사진', '자료사진', '제공', '지난', '이번', '이날', '오는', '현재',
+    '관련', '대한', '위해', '통해', '따르면', '가운데', '이후', '이상', '이하', '올해', '지난해',
+    '때문', '경우', '정도', '대해', '또한', '그리고', '하지만', '그러나', '또는', '모든', '일부',
+    '뉴스', '보스톤', '미국',
+    # 영어
+    'the', 'and', 'for', 'with', 'from', 'that', 'this', 'are', 'was', 'has', 'have',
+    'boston', 'news', 'com', 'www', 'http', 'https',
+))
+
+# 제목에 나온 단어 가중치
+TITLE_WEIGHT = 3.0
+# 말뭉치가 이만큼 쌓이면 너무 흔한 단어(MAX_DF_RATIO 이상 기사에 등장)를 제외
+MIN_CORPUS = 20
+MAX_DF_RATIO = 0.3
+# 저장 시 유지할 최대 단어 수 (넘치면 df가 낮은 단어부터 삭제)
+MAX_TERMS = 100_000
+# 중복 반영 방지용으로 기억할 최근 기사 URL 수 (넘치면 가장 오래 안 본 것부터 잊음)
+MAX_SEEN = 20_000
+# 이 개수만큼 새 기사가 반영될 때마다 자동 저장
+AUTOSAVE_EVERY = 50
+
+
+def _normalize(word: str):
+    """한글 단어에서 조사를 떼고, 서술어/불용어면 None."""
+    if word.endswith(_PREDICATE_ENDINGS):
+        return None
+    for particle in _PARTICLES:
+        if word.endswith(particle) and len(word) - len(particle) >= 2:
+            word = word[:-len(particle)]
+            break
+    if word in STOPWORDS:
+        return None
+    return word
+
+
+def _words(text: str):
+    """(정규화된 단어, 표시용 형태)를 순서대로 생성. 영문은 소문자로 셈."""
+    for match in _HANGUL_RE.finditer(text or ''):
+        word = _normalize(match.group())
+        if word:
+            yield word, word
+    for match in _ENGLISH_RE.finditer(text or ''):
+        word = match.group()
+        key = word.lower()
+        # 두 글자는 대문자 약어(AI, UN 등)만
+        if (len(key) >= 3 or word.isupper()) and key not in STOPWORDS:
+            yield key, word
+
+
+def tokenize(text: str) -> dict:
+    """
+    텍스트에서 키워드 후보 추출.
+
+    Returns:
+        {정규화된 단어: 처음 나온 표시용 형태}
+    """
+    terms = {}
+    for key, word in _words(text):
+        terms.setdefault(key, word)
+    return terms
+
+
+def _term_counts(article: dict):
+    """기사의 (단어별 가중 빈도 Counter, 표시용 형태 dict)."""
+    counts = Counter()
+    display = {}
+    for text, weight in ((article.get('title', ''), TITLE_WEIGHT),
+                         (article.get('content', ''), 1.0)):
+        for key, word in _words(text):
+            counts[key] += weight
+            display.setdefault(key, word)
+    return counts, display
+
+
+class KeywordIndex:
+    """기사 말뭉치의 단어별 문서 빈도 (점진 갱신, JSON 저장)"""
+
+    def __init__(self, path=KEYWORD_INDEX, autosave_every=AUTOSAVE_EVERY):
+        self.path = path
+        self.autosave_every = autosave_every
+        self.doc_count = 0
+        self._df = Counter()
+        self._seen = OrderedDict()  # url -> None (최근에 본 순서, LRU)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    # ===== 저장 =====
+
+    def _load(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        self.doc_count = state.get("doc_count", 0)
+        self._df = Counter(state.get("df", {}))
+        self._seen = OrderedDict.fromkeys(state.get("seen", [])[-MAX_SEEN:])
+
+    def save(self):
+        """인덱스를 파일에 저장 (임시 파일에 쓴 뒤 교체)."""
+        if not self.path:
+            return
+        with self._lock:
+            if len(self._df) > MAX_TERMS:
+                self._df = Counter(dict(self._df.most_common(MAX_TERMS)))
+            state = {
+                "doc_count": self.doc_count,
+                "df": dict(self._df),
+                "seen": list(self._seen),
+            }
+            self._pending = 0
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def flush(self):
+        """저장하지 않은 변경이 있을 때만 저장."""
+        if self._pending:
+            self.save()
+
+    # ===== 갱신 =====
+
+    def add(self, article: dict) -> bool:
+        """
+        기사 하나를 통계에 반영 (최근 MAX_SEEN개 URL 안에서 같은 URL은 한 번만).
+
+        Returns:
+            새로 반영했으면 True
+        """
+        url = article.get('url')
+        terms = tokenize(f"{article.get('title', '')}\n{article.get('content', '')}")
+        with self._lock:
+            if url in self._seen:
+                self._seen.move_to_end(url)
+                return False
+            if url:
+                self._seen[url] = None
+                if len(self._seen) > MAX_SEEN:
+                    self._seen.popitem(last=False)
+            self.doc_count += 1
+            self._df.update(terms.keys())
+            self._pending += 1
+            autosave = self.autosave_every and self._pending >= self.autosave_every
+        if autosave:
+            self.save()
+        return True
+
+    def add_many(self, articles) -> int:
+        """여러 기사 반영 후 저장. 새로 반영한 기사 수 반환."""
+        added = sum(1 for article in articles if self.add(article))
+        if added:
+            self.save()
+        return added
+
+    # ===== 조회 =====
+
+    def df(self, term: str) -> int:
+        return self._df.get(term, 0)
+
+    def keywords(self, article: dict, limit: int = 3) -> list:
+        """
+        기사에서 점수(TF-IDF)가 높은 단어 limit개 (표시용 형태).
+
+        아직 통계에 반영되지 않은 기사도 자기 자신을 포함한 것으로 계산합니다.
+        """
+        counts, display = _term_counts(article)
+        if not counts:
+            return []
+        counted = article.get('url') in self._seen
+        total = self.doc_count + (0 if counted else 1)
+        extra = 0 if counted else 1
+
+        scored = []
+        for term, count in counts.items():
+            df = self._df.get(term, 0) + extra
+            if total >= MIN_CORPUS and df > total * MAX_DF_RATIO:
+                continue
+            idf = math.log((1 + total) / (1 + df)) + 1.0
+            scored.append(((1.0 + math.log(count)) * idf, term))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [display[term] for _, term in scored[:limit]]
+
+    def hashtags(self, article: dict, limit: int = 3) -> list:
+        """keywords()를 '#단어' 형태로 (해시태그에 쓸 수 없는 '&' 등은 뺌)."""
+        tags = []
+        for term in self.keywords(article, limit):
+            tag = f"#{_HASHTAG_INVALID_RE.sub('', term)}"
+            if len(tag) > 1 and tag not in tags:
+                tags.append(tag)
+        return tags
+
+    def __len__(self):
+        return len(self._df)
+
+
+_default_index = None
+_default_lock = threading.Lock()
+
+
+def get_keyword_index() -> KeywordIndex:
+    """프로세스 전역 공유 KeywordIndex 반환."""
+    global _default_index
+    if _default_index is None:
+        with _default_lock:
+            if _default_index is None:
+                _default_index = KeywordIndex()
+                # 자동 저장 주기 사이에 반영된 기사도 종료 시 저장
+                atexit.register(_default_index.flush)
+    return _default_index
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 백엔드 모듈
+- parse_html(): 응답 바이트를 바로 파싱해서 BeautifulSoup 호환 문서 반환
+- 백엔드: selectolax(lexbor) > lxml > html.parser 순으로 설치된 것 중 가장 빠른 것 사용
+
+selectolax 문서는 _LexborNode로 감싸서 select_one / select / get_text / get /
+decompose 만 BeautifulSoup과 같은 의미로 제공합니다. 봇의 CSS 선택자와
+출력 dict는 백엔드와 무관하게 동일합니다.
+"""
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+BACKENDS = ('selectolax', 'lxml', 'html.parser')
+
+# get_text(strip=True) 구현용 내부 구분자 (본문에 나올 일이 없는 문자)
+_TEXT_SEP = '\x00'
+
+
+def _has_module(name):
+    try:
+        __import__(name)
+        return True
+    except ImportError:
+        return False
+
+
+def available_backends() -> list:
+    """현재 환경에서 사용 가능한 백엔드 (빠른 순)."""
+    found = []
+    if _has_module('selectolax'):
+        found.append('selectolax')
+    if _has_module('lxml'):
+        found.append('lxml')
+    found.append('html.parser')
+    return found
+
+
+def default_backend() -> str:
+    """설치된 것 중 가장 빠른 백엔드 이름."""
+    return available_backends()[0]
+
+
+class _LexborNode:
+    """selectolax 노드를 BeautifulSoup Tag처럼 쓰기 위한 얇은 래퍼"""
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    def select_one(self, selector):
+        node = self._node.css_first(selector)
+        return _LexborNode(node) if node is not None else None
+
+    def select(self, selector):
+        return [_LexborNode(node) for node in self._node.css(selector)]
+
+    def get(self, key, default=None):
+        value = self._node.attributes.get(key)
+        return default if value is None else value
+
+    def get_text(self, separator='', strip=False):
+        """BeautifulSoup.get_text와 같은 규칙: strip이면 각 텍스트 조각을 다듬고 빈 조각 제외."""
+        if not strip:
+            return self._node.text(deep=True, separator=separator)
+        pieces = self._node.text(deep=True, separator=_TEXT_SEP).split(_TEXT_SEP)
+        return separator.join(p for p in (piece.strip() for piece in pieces) if p)
+
+    @property
+    def stripped_strings(self):
+        """다듬은 텍스트 조각을 하나씩 (빈 조각 제외)."""
+        for piece in self._node.text(deep=True, separator=_TEXT_SEP).split(_TEXT_SEP):
+            piece = piece.strip()
+            if piece:
+                yield piece
+
+    def decompose(self):
+        self._node.decompose()
+
+
+class _RegionStrainer(SoupStrainer):
+    """
+    지정한 id 또는 class를 가진 태그(와 그 하위 트리)만 트리로 만드는 SoupStrainer.
+    사이드바, 인기기사, 푸터 등 나머지 영역은 Tag 객체를 만들지 않고 건너뜁니다.
+    """
+
+    def __init__(self, ids=(), classes=()):
+        super().__init__()
+        self.ids = frozenset(ids)
+        self.classes = frozenset(classes)
+
+    def _wanted(self, attrs):
+        if not attrs:
+            return False
+        if attrs.get('id') in self.ids:
+            return True
+        class_value = attrs.get('class')
+        if not class_value:
+            return False
+        if isinstance(class_value, str):
+            class_value = class_value.split()
+        return not self.classes.isdisjoint(class_value)
+
+    # beautifulsoup4 >= 4.13
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self._wanted(attrs)
+
+    def allow_string_creation(self, string):
+        return False
+
+    # beautifulsoup4 4.12
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return markup_name if self._wanted(markup_attrs) else None
+
+
+def _parse_selectolax(content):
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+        tree = LexborHTMLParser(content)
+    except ImportError:
+        from selectolax.parser import HTMLParser
+        tree = HTMLParser(content)
+    return _LexborNode(tree.root)
+
+
+def parse_html(content: bytes, backend: str = None, only_ids=(), only_classes=()):
+    """
+    HTML 바이트를 파싱 (UTF-8 가정, 문자열 디코딩 복사 없음).
+
+    Args:
+        content: 응답 본문 바이트
+        backend: 'selectolax' / 'lxml' / 'html.parser' (None이면 default_backend())
+        only_ids, only_classes: 지정하면 해당 id/class 영역만 트리로 생성
+            (BeautifulSoup 백엔드 전용. selectolax는 C 파서라 전체를 파싱해도
+            충분히 빠르므로 무시)
+
+    Returns:
+        select_one / select 를 지원하는 문서 객체
+    """
+    backend = backend or default_backend()
+    if backend == 'selectolax':
+        return _parse_selectolax(content)
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 파서 백엔드: {backend}")
+    parse_only = None
+    if only_ids or only_classes:
+        parse_only = _RegionStrainer(only_ids, only_classes)
+    return BeautifulSoup(content, backend, from_encoding='utf-8', parse_only=parse_only)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+HTTP 조건부 요청 캐시 모듈
+- HttpCache: URL별 본문과 검증자(ETag / Last-Modified)를 디스크에 저장하고
+  If-None-Match / If-Modified-Since 요청으로 재검증. 304 응답이면 저장된 본문
+  (또는 저장된 파싱 결과)을 그대로 사용.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from config_manager import CACHE_DIR
+
+DEFAULT_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+class CachedPage:
+    """캐시를 거친 응답. not_modified가 True면 304로 재검증된 저장 본문."""
+
+    def __init__(self, url, content, status_code, not_modified=False):
+        self.url = url
+        self.content = content
+        self.status_code = status_code
+        self.not_modified = not_modified
+
+    @property
+    def ok(self):
+        return self.status_code == 200
+
+
+class HttpCache:
+    """디스크 기반 조건부 요청 캐시 (용량 초과 시 오래 쓰이지 않은 항목부터 삭제)"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.parsed_hits = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._sizes = self._scan()
+
+    # ===== 내부 유틸 =====
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def _scan(self):
+        """디렉토리의 기존 항목 크기 수집."""
+        sizes = {}
+        for name in os.listdir(self.directory):
+            if not name.endswith(".body"):
+                continue
+            key = name[:-5]
+            try:
+                sizes[key] = os.path.getsize(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        return sizes
+
+    def _read_meta(self, meta_path):
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_atomic(self, path, data, mode="wb"):
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        if "b" in mode:
+            with open(tmp, mode) as f:
+                f.write(data)
+        else:
+            with open(tmp, mode, encoding="utf-8") as f:
+                f.write(data)
+        os.replace(tmp, path)
+
+    def _evict(self):
+        """총 용량이 max_bytes 이하가 될 때까지 가장 오래된 항목 삭제."""
+        total = sum(self._sizes.values())
+        if total <= self.max_bytes:
+            return
+        entries = []
+        for key in self._sizes:
+            body_path = os.path.join(self.directory, key + ".body")
+            try:
+                entries.append((os.path.getmtime(body_path), key))
+            except OSError:
+                entries.append((0, key))
+        entries.sort()
+        for _, key in entries:
+            if total <= self.max_bytes:
+                break
+            total -= self._sizes.pop(key, 0)
+            for ext in (".json", ".body"):
+                try:
+                    os.unlink(os.path.join(self.directory, key + ext))
+                except OSError:
+                    pass
+
+    # ===== 공개 API =====
+
+    def fetch(self, client, url) -> CachedPage:
+        """조건부 GET. 304면 저장 본문 반환, 200이면 캐시 갱신."""
+        meta_path, body_path = self._paths(url)
+        meta = self._read_meta(meta_path)
+
+        headers = {}
+        if meta and os.path.exists(body_path):
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = client.get(url, headers=headers)
+
+        if response.status_code == 304 and headers:
+            try:
+                with open(body_path, "rb") as f:
+                    content = f.read()
+                now = time.time()
+                os.utime(body_path, (now, now))
+                with self._lock:
+                    self.hits += 1
+                return CachedPage(url, content, 200, not_modified=True)
+            except OSError:
+                # 본문이 사라졌으면 무조건 다시 받기
+                response = client.get(url)
+
+        with self._lock:
+            self.misses += 1
+
+        if response.status_code == 200:
+            self._store(url, response)
+        return CachedPage(url, response.content, response.status_code)
+
+    def _store(self, url, response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return  # 재검증할 수단이 없으면 저장하지 않음
+
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+            "parsed": {},  # 본문이 바뀌면 파싱 결과도 무효
+        }
+        with self._lock:
+            self._write_atomic(body_path, response.content)
+            self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False), mode="w")
+            key = os.path.basename(body_path)[:-5]
+            self._sizes[key] = len(response.content)
+            self._evict()
+
+    def load_parsed(self, url, kind):
+        """저장된 파싱 결과 조회. 없으면 None."""
+        meta_path, _ = self._paths(url)
+        meta = self._read_meta(meta_path)
+        if not meta:
+            return None
+        value = meta.get("parsed", {}).get(kind)
+        if value is not None:
+            with self._lock:
+                self.parsed_hits += 1
+        return value
+
+    def store_parsed(self, url, kind, value):
+        """현재 저장된 본문에 대한 파싱 결과 기록."""
+        meta_path, _ = self._paths(url)
+        with self._lock:
+            meta = self._read_meta(meta_path)
+            if not meta:
+                return
+            meta.setdefault("parsed", {})[kind] = value
+            self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False), mode="w")
+
+    def stats(self) -> dict:
+        """적중/실패 카운터와 현재 용량."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "parsed_hits": self.parsed_hits,
+                "entries": len(self._sizes),
+                "bytes": sum(self._sizes.values()),
+            }
+
+    def clear(self):
+        """모든 항목 삭제."""
+        with self._lock:
+            for key in list(self._sizes):
+                for ext in (".json", ".body"):
+                    try:
+                        os.unlink(os.path.join(self.directory, key + ext))
+                    except OSError:
+                        pass
+            self._sizes.clear()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """프로세스 전역 공유 HttpCache 반환."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = HttpCache()
+    return _default_cache
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+HTTP 세션 모듈 - 모든 외부 요청이 공유하는 keep-alive 연결 풀
+- HttpClient: 호스트별 연결 풀 크기, 기본 타임아웃, 압축 협상을 갖춘 세션 래퍼
+- get_client(): 프로세스 전역 공유 클라이언트
+
+모든 요청은 rate_limiter의 호스트별 토큰 버킷을 거칩니다.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import get_rate_limiter
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# (connect, read) 초 단위
+DEFAULT_TIMEOUT = (5, 30)
+
+# 호스트별 연결 풀 크기 (목록에 없는 호스트는 DEFAULT_POOL_SIZE 사용)
+DEFAULT_POOL_SIZE = 4
+HOST_POOL_SIZES = {
+    'www.bostonkorea.com': 10,
+}
+
+
+def _accept_encoding():
+    """brotli 디코더가 설치된 경우에만 br 협상."""
+    encodings = ['gzip', 'deflate']
+    try:
+        import brotli  # noqa: F401
+        encodings.append('br')
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append('br')
+        except ImportError:
+            pass
+    return ', '.join(encodings)
+
+
+class HttpClient:
+    """스레드 간 공유 가능한 requests.Session 래퍼"""
+
+    def __init__(self, pool_sizes=None, timeout=DEFAULT_TIMEOUT, headers=None,
+                 limiter=None, max_retries=2):
+        self.timeout = timeout
+        # 429/503 응답 시 속도 제한기가 정한 만큼 기다린 뒤 재시도할 횟수
+        self.max_retries = max_retries
+        self.limiter = limiter or get_rate_limiter()
+        self._pool_sizes = dict(HOST_POOL_SIZES)
+        if pool_sizes:
+            self._pool_sizes.update(pool_sizes)
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': _accept_encoding(),
+        })
+        if headers:
+            self.session.headers.update(headers)
+
+        default_adapter = HTTPAdapter(pool_connections=DEFAULT_POOL_SIZE,
+                                      pool_maxsize=DEFAULT_POOL_SIZE)
+        self.session.mount('http://', default_adapter)
+        self.session.mount('https://', default_adapter)
+
+        # 호스트 전용 어댑터는 여기서 미리 마운트. mount()는 session.adapters를 다시
+        # 정렬하므로 요청 중(다른 스레드가 get_adapter로 순회하는 중)에 하면 안 됨
+        for host, size in self._pool_sizes.items():
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            self.session.mount(f"http://{host}/", adapter)
+            self.session.mount(f"https://{host}/", adapter)
+
+    def request(self, method, url, **kwargs):
+        """
+        속도 제한을 거쳐 요청. timeout을 지정하지 않으면 기본값 사용.
+        429/503이면 같은 호스트의 모든 요청이 함께 늦춰지고 max_retries번까지 재시도.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlsplit(url).hostname or ''
+
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(host)
+            response = self.session.request(method, url, **kwargs)
+            throttled = self.limiter.feedback(
+                host, response.status_code, response.headers.get('Retry-After'))
+            if not throttled or attempt == self.max_retries:
+                return response
+            response.close()
+
+    def get(self, url, **kwargs):
+        """GET 요청."""
+        return self.request('GET', url, **kwargs)
+
+    def warmup(self, urls):
+        """시작 시 HEAD 요청으로 TCP+TLS 연결을 미리 열어 둠. 실패는 무시."""
+        for url in urls:
+            try:
+                self.request('HEAD', url, allow_redirects=False)
+            except requests.RequestException:
+                pass
+
+    def close(self):
+        self.session.close()
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """프로세스 전역 공유 HttpClient 반환."""
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = HttpClient()
+    return _default_client
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+이미지 캐시 모듈 - 카드 생성기와 포스터가 같은 원본 이미지를 한 번만 다운로드
+- ImageCache: 원본 바이트를 내용 해시(sha256) 이름으로 디스크에 저장하고
+  URL → 해시 색인으로 찾음 (같은 사진이 여러 URL로 올라와도 한 벌만 저장).
+  용량을 넘으면 가장 오래 쓰이지 않은 파일부터 삭제
+- 디코딩은 메모리 버퍼(BytesIO)에서 바로 수행 (임시 파일 없음)
+- jpeg_path(): JPEG만 받는 업로드(인스타그램)용으로 변환한 사본 경로
+- get_image_cache(): 프로세스 전역 공유 캐시
+
+기사 이미지 URL은 내용이 바뀌지 않는다고 보고 재검증하지 않습니다.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+
+from PIL import Image
+
+from config_manager import CACHE_DIR
+from http_client import get_client
+
+DEFAULT_IMAGE_DIR = os.path.join(CACHE_DIR, "images")
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# PIL 포맷 → 파일 확장자 (instagrapi 등 확장자를 보는 라이브러리용)
+_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "GIF": ".gif", "WEBP": ".webp"}
+# 원본이 JPEG가 아닐 때 만드는 JPEG 사본의 이름 접미사와 품질
+_JPEG_SUFFIX = ".converted.jpg"
+JPEG_QUALITY = 95
+# URL별 다운로드 잠금 수 (URL 해시로 나눠 쓰므로 URL이 늘어도 잠금 수는 고정)
+URL_LOCK_STRIPES = 64
+
+
+class ImageCache:
+    """내용 주소 기반 이미지 원본 캐시 (용량 초과 시 LRU 삭제)"""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory=DEFAULT_IMAGE_DIR, max_bytes=DEFAULT_MAX_BYTES, client=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.client = client
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # URL별 다운로드 잠금 (카드 생성과 게시가 동시에 같은 이미지를 받지 않도록)
+        self._url_locks = [threading.Lock() for _ in range(URL_LOCK_STRIPES)]
+        os.makedirs(directory, exist_ok=True)
+        self._index = self._load_index()  # url -> 파일 이름 (해시 + 확장자)
+        self._sizes = self._scan()        # 파일 이름 -> 크기
+
+    # ===== 내부 유틸 =====
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.directory, self.INDEX_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self):
+        """잠금을 잡은 상태에서 호출."""
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def _scan(self):
+        sizes = {}
+        for name in os.listdir(self.directory):
+            if name == self.INDEX_FILE or name.endswith(".tmp"):
+                continue
+            try:
+                sizes[name] = os.path.getsize(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        return sizes
+
+    def _evict(self):
+        """잠금을 잡은 상태에서 호출. 총 용량이 max_bytes 이하가 될 때까지 삭제."""
+        total = sum(self._sizes.values())
+        if total <= self.max_bytes:
+            return
+        entries = []
+        for name in self._sizes:
+            try:
+                entries.append((os.path.getmtime(os.path.join(self.directory, name)), name))
+            except OSError:
+                entries.append((0, name))
+        entries.sort()
+        removed = set()
+        for _, name in entries:
+            if total <= self.max_bytes:
+                break
+            total -= self._sizes.pop(name, 0)
+            removed.add(name)
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        self._index = {url: name for url, name in self._index.items() if name not in removed}
+        self._save_index()
+
+    def _url_lock(self, url):
+        return self._url_locks[hash(url) % len(self._url_locks)]
+
+    def _cached_name(self, url):
+        """저장된 파일 이름 (없거나 파일이 사라졌으면 None). 찾으면 사용 시각 갱신."""
+        with self._lock:
+            name = self._index.get(url)
+        if not name:
+            return None
+        path = os.path.join(self.directory, name)
+        try:
+            now = time.time()
+            os.utime(path, (now, now))
+        except OSError:
+            return None
+        return name
+
+    def _download(self, url):
+        """다운로드 후 저장. (파일 이름, 바이트) 반환."""
+        response = (self.client or get_client()).get(url)
+        response.raise_for_status()
+        data = response.content
+
+        try:
+            fmt = Image.open(io.BytesIO(data)).format
+        except Exception:
+            fmt = None
+        name = hashlib.sha256(data).hexdigest() + _EXTENSIONS.get(fmt, ".img")
+        path = os.path.join(self.directory, name)
+
+        with self._lock:
+            if name not in self._sizes:
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+                self._sizes[name] = len(data)
+            self._index[url] = name
+            self._save_index()
+            self._evict()
+        return name, data
+
+    # ===== 공개 API =====
+
+    def fetch(self, url):
+        """
+        원본 바이트와 캐시 파일 경로 반환 (캐시에 없으면 다운로드).
+
+        Returns:
+            (bytes, 파일 경로) 튜플
+        """
+        with self._url_lock(url):
+            name = self._cached_name(url)
+            if name:
+                try:
+                    with open(os.path.join(self.directory, name), "rb") as f:
+                        data = f.read()
+                    with self._lock:
+                        self.hits += 1
+                    return data, os.path.join(self.directory, name)
+                except OSError:
+                    pass
+            with self._lock:
+                self.misses += 1
+            name, data = self._download(url)
+            return data, os.path.join(self.directory, name)
+
+    def path(self, url) -> str:
+        """캐시 파일 경로 (파일을 요구하는 업로드 라이브러리용)."""
+        return self.fetch(url)[1]
+
+    def jpeg_path(self, url) -> str:
+        """
+        JPEG 파일 경로 (instagrapi photo_upload처럼 JPEG만 받는 업로드용).
+        원본이 PNG/WEBP/GIF 등이면 RGB로 변환한 사본을 캐시에 함께 저장해서 반환.
+        """
+        data, path = self.fetch(url)
+        if path.endswith(".jpg"):
+            return path
+        name = os.path.splitext(os.path.basename(path))[0] + _JPEG_SUFFIX
+        jpeg = os.path.join(self.directory, name)
+        with self._url_lock(url):
+            if self._cached_jpeg(name):
+                return jpeg
+            with Image.open(io.BytesIO(data)) as img:
+                img = img.convert("RGBA")
+                # 투명 영역은 흰 배경으로
+                background = Image.new("RGB", img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel("A"))
+            tmp = f"{jpeg}.{threading.get_ident()}.tmp"
+            background.save(tmp, "JPEG", quality=JPEG_QUALITY)
+            os.replace(tmp, jpeg)
+            with self._lock:
+                self._sizes[name] = os.path.getsize(jpeg)
+                self._evict()
+        return jpeg
+
+    def _cached_jpeg(self, name):
+        """변환 사본이 이미 있으면 사용 시각을 갱신하고 True."""
+        with self._lock:
+            if name not in self._sizes:
+                return False
+        try:
+            now = time.time()
+            os.utime(os.path.join(self.directory, name), (now, now))
+        except OSError:
+            return False
+        return True
+
+    def open_image(self, url) -> Image.Image:
+        """
+        메모리 버퍼 위에서 연 PIL Image 반환 (변환 전 원본 모드).
+        픽셀은 아직 디코딩하지 않으므로 호출한 쪽에서 draft()로 축소 디코딩 가능.
+        """
+        data, _ = self.fetch(url)
+        return Image.open(io.BytesIO(data))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "urls": len(self._index),
+                "files": len(self._sizes),
+                "bytes": sum(self._sizes.values()),
+            }
+
+    def clear(self):
+        """모든 항목 삭제."""
+        with self._lock:
+            for name in list(self._sizes):
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+            self._sizes.clear()
+            self._index.clear()
+            self._save_index()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """프로세스 전역 공유 ImageCache 반환."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = ImageCache()
+    return _default_cache
@@ -2,100 +2,507 @@
 """
 미디어 생성 모듈
 - CardGenerator: 기사 카드 이미지 생성 (PIL)
-- VideoGenerator: 카드 이미지로 줌 효과 동영상 생성 (imageio)
+- CardTemplate: 크기/테마별 고정 레이어(그라데이션, 뱃지, 브랜딩) 캐시 (get_card_template()로 공유)
+- VideoGenerator: 카드 이미지로 줌 효과 동영상 생성 (ffmpeg zoompan 또는 파이썬 프레임 파이프)
+- FontRegistry: 한국어 폰트 경로/객체 캐시 (get_font_registry()로 공유)
 """
 
+import hashlib
+import math
+import multiprocessing
 import os
+import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache
 
-import requests
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 
+from image_cache import get_image_cache
 
-def _find_font(bold=False):
-    """한국어 지원 폰트 찾기."""
-    candidates = [
+# resize 시 정수배 축소(reduce)를 먼저 적용하는 기준. 결과 크기의 이 배수 이상이면
+# 빠른 박스 축소 후 LANCZOS로 마무리 (3.0이면 LANCZOS 단독과 눈으로 구분 불가)
+REDUCING_GAP = 3.0
+
+
+# 한국어 지원 폰트 후보 (앞에 있을수록 우선)
+_FONT_CANDIDATES = {
+    False: [
         # Nanum (Linux / 설치된 경우)
-        "/usr/share/fonts/truetype/nanum/NanumSquareB.ttf" if bold else "/usr/share/fonts/truetype/nanum/NanumSquareR.ttf",
-        "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf" if bold else "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+        "/usr/share/fonts/truetype/nanum/NanumSquareR.ttf",
+        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
         # Windows
-        "C:/Windows/Fonts/malgunbd.ttf" if bold else "C:/Windows/Fonts/malgun.ttf",
+        "C:/Windows/Fonts/malgun.ttf",
         # macOS
         "/System/Library/Fonts/AppleSDGothicNeo.ttc",
         "/Library/Fonts/AppleSDGothicNeo.ttc",
         # Noto Sans CJK (Linux)
-        "/usr/share/fonts/truetype/noto/NotoSansCJK-Bold.ttc" if bold else "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
-        "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc" if bold else "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
         # DejaVu fallback
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if bold else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-    ]
-    for path in candidates:
-        if os.path.exists(path):
-            return path
-    return None
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ],
+    True: [
+        "/usr/share/fonts/truetype/nanum/NanumSquareB.ttf",
+        "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf",
+        "C:/Windows/Fonts/malgunbd.ttf",
+        "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+        "/Library/Fonts/AppleSDGothicNeo.ttc",
+        "/usr/share/fonts/truetype/noto/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Bold.ttc",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    ],
+}
+
+
+class FontRegistry:
+    """
+    폰트 경로 탐색 결과와 FreeTypeFont 객체를 프로세스 전체에서 공유.
+    경로는 굵기별로 한 번만 찾고, 폰트 객체는 (경로, 크기, index)별로 한 번만 로드.
+    """
+
+    def __init__(self, candidates=None):
+        self._candidates = candidates or _FONT_CANDIDATES
+        self._paths = {}
+        self._fonts = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, bold=False):
+        """굵기에 맞는 폰트 파일 경로 (없으면 None)."""
+        if bold in self._paths:
+            return self._paths[bold]
+        with self._lock:
+            if bold not in self._paths:
+                self._paths[bold] = next(
+                    (path for path in self._candidates[bold] if os.path.exists(path)), None)
+            return self._paths[bold]
+
+    def get(self, size, bold=False, index=0):
+        """지정 크기의 폰트 (캐시된 객체를 그대로 반환하므로 수정하지 말 것)."""
+        path = self.resolve(bold)
+        key = (path, size, index)
+        font = self._fonts.get(key)
+        if font is None:
+            with self._lock:
+                font = self._fonts.get(key)
+                if font is None:
+                    if path:
+                        font = ImageFont.truetype(path, size, index=index)
+                    else:
+                        font = ImageFont.load_default()
+                    self._fonts[key] = font
+        return font
+
+    def warmup(self, specs=None):
+        """자주 쓰는 (크기, 굵기) 폰트를 미리 로드. 기본은 카드 생성기의 폰트."""
+        for size, bold in specs or CardGenerator.FONT_SPECS:
+            self.get(size, bold)
+
+    def selected(self) -> dict:
+        """선택된 폰트 경로 (진단용). 찾지 못했으면 None (PIL 기본 폰트 사용)."""
+        return {"regular": self.resolve(False), "bold": self.resolve(True)}
+
+
+_default_registry = None
+_default_lock = threading.Lock()
+
+
+def get_font_registry() -> FontRegistry:
+    """프로세스 전역 공유 FontRegistry 반환."""
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = FontRegistry()
+    return _default_registry
 
 
 def _load_font(size, bold=False):
-    """지정 크기의 폰트 로드."""
-    path = _find_font(bold)
-    if path:
-        return ImageFont.truetype(path, size)
-    return ImageFont.load_default()
+    """지정 크기의 폰트 로드 (공유 레지스트리 캐시 사용)."""
+    return get_font_registry().get(size, bold)
 
 
 def _download_image(url):
-    """URL에서 이미지 다운로드하여 PIL Image 반환."""
-    resp = requests.get(url, timeout=30, headers={
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    })
-    resp.raise_for_status()
-    fd, tmp = tempfile.mkstemp(suffix=".jpg")
-    os.close(fd)
-    with open(tmp, "wb") as f:
-        f.write(resp.content)
-    img = Image.open(tmp).convert("RGB")
-    os.unlink(tmp)
-    return img
+    """
+    URL의 이미지를 공유 이미지 캐시를 거쳐 메모리 버퍼에서 연 PIL Image 반환.
+    아직 디코딩 전이므로 _crop_to_fill이 필요한 해상도로만 디코딩함.
+    """
+    return get_image_cache().open_image(url)
 
 
 def _crop_to_fill(img, target_w, target_h):
-    """이미지를 대상 크기에 맞게 크롭 + 리사이즈."""
+    """
+    이미지를 대상 크기에 맞게 크롭 + 리사이즈.
+
+    JPEG는 디코딩 전에 draft()로 크롭 영역이 대상 크기를 덮는 가장 작은 배율
+    (1/2, 1/4, 1/8)을 요청해서 큰 원본(3000~4000px)을 통째로 풀지 않음.
+    나머지 축소는 resize(box=..., reducing_gap=...)가 크롭과 함께 한 번에 처리.
+    """
     img_w, img_h = img.size
     target_ratio = target_w / target_h
     img_ratio = img_w / img_h
 
     if img_ratio > target_ratio:
-        new_h = img_h
-        new_w = int(img_h * target_ratio)
-        left = (img_w - new_w) // 2
-        img = img.crop((left, 0, left + new_w, new_h))
+        crop_w, crop_h = img_h * target_ratio, img_h
     else:
-        new_w = img_w
-        new_h = int(img_w / target_ratio)
-        top = (img_h - new_h) // 2
-        img = img.crop((0, top, new_w, top + new_h))
+        crop_w, crop_h = img_w, img_w / target_ratio
+
+    left = (img_w - crop_w) / 2
+    top = (img_h - crop_h) / 2
+
+    if img.format == "JPEG":
+        scale = max(target_w / crop_w, target_h / crop_h)
+        if scale < 1:
+            img.draft("RGB", (math.ceil(img_w * scale), math.ceil(img_h * scale)))
+            # draft는 가로/세로를 따로 올림하므로 (4001x3000 → 501x375) 축별 배율로 환산
+            factor_x = img.size[0] / img_w
+            factor_y = img.size[1] / img_h
+            left, crop_w = left * factor_x, crop_w * factor_x
+            top, crop_h = top * factor_y, crop_h * factor_y
+            img_w, img_h = img.size
+
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    # 부동소수점 오차로 영역이 이미지 밖으로 나가지 않도록
+    box = (max(0.0, left), max(0.0, top),
+           min(float(img_w), left + crop_w), min(float(img_h), top + crop_h))
+    return img.resize((target_w, target_h), Image.LANCZOS, box=box,
+                      reducing_gap=REDUCING_GAP)
+
+
+# 카드 하단 그라데이션: 위에서 GRADIENT_START 비율 지점부터 아래로 갈수록
+# 검정 오버레이 불투명도가 0 → GRADIENT_MAX_ALPHA로 증가
+GRADIENT_START = 0.4
+GRADIENT_MAX_ALPHA = 220
+
+
+@lru_cache(maxsize=8)
+def _gradient_multiplier(w, h):
+    """
+    하단 그라데이션 구간을 곱하기 합성용 RGB 이미지로 (크기별 캐시, 수정 금지).
+    불투명도 a인 검정을 덮는 것은 원본에 (255 - a) / 255를 곱하는 것과 같음.
+
+    Returns:
+        (그라데이션 시작 y, 구간 높이만큼의 배율 이미지)
+    """
+    import numpy as np
+
+    start = int(h * GRADIENT_START)
+    rows = np.arange(h - start)
+    alpha = (GRADIENT_MAX_ALPHA * rows / (h - start)).astype(np.int32)
+    column = (255 - alpha).astype(np.uint8)
+    plane = np.broadcast_to(column[:, None, None], (h - start, w, 3))
+    return start, Image.fromarray(np.ascontiguousarray(plane), "RGB")
+
+
+def _apply_gradient(img):
+    """img(RGB) 하단을 제자리에서 어둡게 (위쪽 40%는 건드리지 않음)."""
+    w, h = img.size
+    start, multiplier = _gradient_multiplier(w, h)
+    region = img.crop((0, start, w, h))
+    img.paste(ImageChops.multiply(region, multiplier), (0, start))
+    return img
 
-    return img.resize((target_w, target_h), Image.LANCZOS)
 
+@lru_cache(maxsize=8)
+def _default_background(w, h):
+    """사진이 없을 때 쓰는 남색 세로 그라데이션 (크기별 캐시, 수정 금지)."""
+    import numpy as np
+
+    t = np.arange(h) / h
+    column = np.stack([20 + 30 * t, 30 + 20 * t, 60 + 40 * t], axis=1).astype(np.uint8)
+    plane = np.broadcast_to(column[:, None, :], (h, w, 3))
+    return Image.fromarray(np.ascontiguousarray(plane), "RGB")
+
+
+# 폰트별 글자 폭 캐시: 폰트 키 -> {글자: advance(px)}
+_glyph_advances = {}
+
+# 이 글자 뒤에서는 공백이 없어도 줄을 바꿀 수 있음
+_BREAK_AFTER = set(",·/)]}…!?")
+
+ELLIPSIS = "…"
+
+
+def _font_key(font):
+    path = getattr(font, "path", None)
+    if path is None:
+        return id(font)
+    return (path, font.size, getattr(font, "index", 0))
+
+
+def _advances(font):
+    """폰트의 글자 폭 캐시 (같은 경로/크기/index면 폰트 객체가 달라도 공유)."""
+    key = _font_key(font)
+    table = _glyph_advances.get(key)
+    if table is None:
+        table = _glyph_advances.setdefault(key, {})
+    return table
+
+
+def _text_width(text, font, table=None):
+    """글자별 advance의 합 (각 글자는 폰트마다 한 번만 측정)."""
+    if table is None:
+        table = _advances(font)
+    width = 0.0
+    for char in text:
+        advance = table.get(char)
+        if advance is None:
+            advance = table[char] = font.getlength(char)
+        width += advance
+    return width
 
-def _wrap_text(text, font, max_width, draw):
-    """텍스트를 최대 너비에 맞게 줄바꿈."""
-    lines = []
-    current_line = ""
 
+def _split_words(text):
+    """줄바꿈 가능한 단위로 분리. 공백은 따로, 구두점은 앞 단어에 붙임."""
+    words = []
+    current = ""
     for char in text:
-        test_line = current_line + char
-        bbox = draw.textbbox((0, 0), test_line, font=font)
-        if bbox[2] - bbox[0] > max_width and current_line:
-            lines.append(current_line)
-            current_line = char
+        if char == " ":
+            if current:
+                words.append(current)
+                current = ""
+            words.append(" ")
         else:
-            current_line = test_line
+            current += char
+            if char in _BREAK_AFTER:
+                words.append(current)
+                current = ""
+    if current:
+        words.append(current)
+    return words
+
+
+def _wrap_text(text, font, max_width, draw=None, max_lines=4):
+    """
+    텍스트를 최대 너비에 맞게 줄바꿈 (최대 max_lines줄).
+
+    띄어쓰기(어절)와 구두점 뒤에서 우선 줄을 바꾸고, 한 어절이 한 줄보다 길면
+    글자 단위로 나눕니다. 줄 수를 넘는 부분은 마지막 줄 끝에 말줄임표를 붙입니다.
+    글자 폭은 폰트별 캐시에서 읽으므로 제목 길이에 비례하는 시간으로 끝납니다.
+    draw는 이전 시그니처 호환용으로 사용하지 않습니다.
+    """
+    table = _advances(font)
+    space_w = _text_width(" ", font, table)
+    lines = []
+    line, line_w = "", 0.0
+    pending_space = False
+    truncated = False
+
+    for word in _split_words(" ".join(text.split())):
+        if word == " ":
+            pending_space = bool(line)
+            continue
+        word_w = _text_width(word, font, table)
+        gap = space_w if pending_space else 0.0
+        pending_space = False
+
+        if line and line_w + gap + word_w <= max_width:
+            line += (" " if gap else "") + word
+            line_w += gap + word_w
+            continue
+        if line:
+            lines.append(line)
+            line, line_w = "", 0.0
+            if len(lines) == max_lines:
+                truncated = True
+                break
+        if word_w <= max_width:
+            line, line_w = word, word_w
+            continue
+
+        # 한 줄보다 긴 어절은 글자 단위로 나눔
+        for char in word:
+            char_w = table[char]
+            if line and line_w + char_w > max_width:
+                lines.append(line)
+                line, line_w = "", 0.0
+                if len(lines) == max_lines:
+                    truncated = True
+                    break
+            line += char
+            line_w += char_w
+        if truncated:
+            break
+
+    if not truncated and line:
+        lines.append(line)
+        truncated = len(lines) > max_lines
+    if truncated:
+        lines = lines[:max_lines]
+        last = lines[-1]
+        ellipsis_w = _text_width(ELLIPSIS, font, table)
+        last_w = _text_width(last, font, table)
+        while last and last_w + ellipsis_w > max_width:
+            last_w -= table[last[-1]]
+            last = last[:-1]
+        lines[-1] = last.rstrip() + ELLIPSIS
+    return lines
+
+
+# 카드 테마: 색상과 브랜딩 문구 (CardTemplate이 테마별로 고정 레이어를 미리 그림)
+CARD_THEMES = {
+    "default": {
+        "badge_fill": (220, 50, 50),
+        "badge_text": (255, 255, 255),
+        "title_fill": (255, 255, 255),
+        "shadow_fill": (0, 0, 0),
+        "brand_fill": (200, 200, 200),
+        "brand_text": "보스톤코리아  |  bostonkorea.com",
+    },
+}
+
+# 카드 PNG 압축 수준 (0~9). PNG는 무손실이라 화질은 같고, 낮을수록 저장이 빠른 대신 파일이 큼
+PNG_COMPRESS_LEVEL = 1
+
+
+class _Layer:
+    """배경 위에 붙일 고정 레이어 조각 (위치, 색상 이미지, 마스크)"""
+
+    __slots__ = ("offset", "image", "mask")
+
+    def __init__(self, offset, image, mask):
+        self.offset = offset
+        self.image = image
+        self.mask = mask
+
+    def apply(self, card):
+        card.paste(self.image, self.offset, self.mask)
+
+
+class CardTemplate:
+    """
+    카드 레이아웃 템플릿 - 크기/테마별 고정 레이어를 한 번만 그려 두고 재사용.
+    - 하단 그라데이션: 크기별 배율 이미지 (_gradient_multiplier)
+    - 브랜딩 문구: 글자 마스크와 색상 조각
+    - 카테고리 뱃지: 카테고리별로 처음 쓸 때 한 번 그림
+    카드 한 장을 만들 때는 배경 사진 위에 이 레이어들을 붙이고 제목만 새로 그립니다.
+
+    고정 레이어는 (색상 조각, 마스크)로 저장해 paste 한 번으로 붙이므로,
+    이전처럼 카드마다 RGBA로 변환해서 직접 그린 결과와 픽셀 단위로 같습니다.
+    """
+
+    # (크기, 굵기): 제목, 카테고리 뱃지, 브랜딩
+    TITLE_FONT = (52, True)
+    CATEGORY_FONT = (26, True)
+    BRAND_FONT = (22, False)
+    FONT_SPECS = (TITLE_FONT, CATEGORY_FONT, BRAND_FONT)
+
+    # 레이아웃 (px)
+    MARGIN = 60
+    LINE_HEIGHT = 64
+    TITLE_BOTTOM = 140
+    BRAND_BOTTOM = 65
+    BADGE_ORIGIN = (40, 40)
+    BADGE_PAD = 8
+    BADGE_RADIUS = 8
+    SHADOW_OFFSET = 2
+
+    def __init__(self, size=(1080, 1080), theme="default"):
+        self.size = tuple(size)
+        self.theme_name = theme
+        self.theme = CARD_THEMES[theme]
+        self.title_font = _load_font(*self.TITLE_FONT)
+        self.category_font = _load_font(*self.CATEGORY_FONT)
+        self.brand_font = _load_font(*self.BRAND_FONT)
+        self._badges = {}
+        self._lock = threading.Lock()
+        self._brand = self._render_brand()
+
+    # ===== 고정 레이어 =====
+
+    def _render_brand(self):
+        w, h = self.size
+        text = self.theme["brand_text"]
+        origin = (self.MARGIN, h - self.BRAND_BOTTOM)
+        left, top, right, bottom = self.brand_font.getbbox(text)
+        box = (origin[0] + left, origin[1] + top,
+               min(origin[0] + right, w), min(origin[1] + bottom, h))
+        box_w, box_h = box[2] - box[0], box[3] - box[1]
+        mask = Image.new("L", (box_w, box_h), 0)
+        ImageDraw.Draw(mask).text((origin[0] - box[0], origin[1] - box[1]), text,
+                                  font=self.brand_font, fill=255)
+        image = Image.new("RGB", (box_w, box_h), self.theme["brand_fill"])
+        return _Layer(box[:2], image, mask)
+
+    def _render_badge(self, category):
+        text = f"  {category}  "
+        left, top, right, bottom = self.category_font.getbbox(text)
+        pad = self.BADGE_PAD
+        box_w = right - left + pad * 2 + 1
+        box_h = bottom - top + pad * 2 + 1
+        shape = [0, 0, box_w - 1, box_h - 1]
+
+        mask = Image.new("L", (box_w, box_h), 0)
+        ImageDraw.Draw(mask).rounded_rectangle(shape, radius=self.BADGE_RADIUS, fill=255)
+        image = Image.new("RGB", (box_w, box_h), self.theme["badge_fill"])
+        ImageDraw.Draw(image).text((pad, pad), text, font=self.category_font,
+                                   fill=self.theme["badge_text"])
+        return _Layer(self.BADGE_ORIGIN, image, mask)
+
+    def badge(self, category):
+        """카테고리 뱃지 레이어 (카테고리별 캐시)."""
+        layer = self._badges.get(category)
+        if layer is None:
+            with self._lock:
+                layer = self._badges.get(category)
+                if layer is None:
+                    layer = self._badges[category] = self._render_badge(category)
+        return layer
+
+    def warmup(self, categories=()):
+        """그라데이션, 기본 배경, 카테고리 뱃지를 미리 그림."""
+        _gradient_multiplier(*self.size)
+        _default_background(*self.size)
+        for category in categories:
+            if category:
+                self.badge(category)
+
+    # ===== 렌더링 =====
+
+    def render(self, title, category, background):
+        """
+        배경(RGB, 카드 크기) 위에 고정 레이어와 제목을 합성한 카드 반환.
+        background는 제자리에서 수정됩니다.
+        """
+        card = _apply_gradient(background)
+        if category:
+            self.badge(category).apply(card)
+
+        # 제목 (하단): 기사마다 다른 유일한 레이어
+        w, h = self.size
+        lines = _wrap_text(title, self.title_font, w - self.MARGIN * 2)
+        text_y = h - self.TITLE_BOTTOM - len(lines) * self.LINE_HEIGHT
+        draw = ImageDraw.Draw(card)
+        shadow = self.SHADOW_OFFSET
+        for line in lines:
+            draw.text((self.MARGIN + shadow, text_y + shadow), line, font=self.title_font,
+                      fill=self.theme["shadow_fill"])
+            draw.text((self.MARGIN, text_y), line, font=self.title_font,
+                      fill=self.theme["title_fill"])
+            text_y += self.LINE_HEIGHT
 
-    if current_line:
-        lines.append(current_line)
+        self._brand.apply(card)
+        return card
 
-    return lines[:4]  # 최대 4줄
+
+_templates = {}
+_templates_lock = threading.Lock()
+
+
+def get_card_template(size=(1080, 1080), theme="default") -> CardTemplate:
+    """(크기, 테마)별 프로세스 전역 공유 CardTemplate 반환."""
+    key = (tuple(size), theme)
+    template = _templates.get(key)
+    if template is None:
+        with _templates_lock:
+            template = _templates.get(key)
+            if template is None:
+                template = _templates[key] = CardTemplate(size, theme)
+    return template
 
 
 class CardGenerator:
@@ -103,6 +510,20 @@ class CardGenerator:
 
     CARD_SIZE = (1080, 1080)
 
+    # (크기, 굵기): 제목, 카테고리 뱃지, 브랜딩
+    TITLE_FONT = CardTemplate.TITLE_FONT
+    CATEGORY_FONT = CardTemplate.CATEGORY_FONT
+    BRAND_FONT = CardTemplate.BRAND_FONT
+    FONT_SPECS = CardTemplate.FONT_SPECS
+
+    def __init__(self, theme="default", template=None):
+        """
+        Args:
+            theme: CARD_THEMES의 테마 이름
+            template: 사용할 CardTemplate (None이면 크기/테마별 공유 템플릿)
+        """
+        self.template = template or get_card_template(self.CARD_SIZE, theme)
+
     def generate(self, title, category, image_source, output_path=None):
         """
         카드 이미지 생성.
@@ -120,7 +541,7 @@ class CardGenerator:
             fd, output_path = tempfile.mkstemp(suffix=".png")
             os.close(fd)
 
-        w, h = self.CARD_SIZE
+        w, h = self.template.size
 
         # 배경 이미지 로드
         if image_source:
@@ -128,86 +549,238 @@ class CardGenerator:
                 if image_source.startswith("http"):
                     bg_img = _download_image(image_source)
                 else:
-                    bg_img = Image.open(image_source).convert("RGB")
-                bg = _crop_to_fill(bg_img, w, h)
+                    bg_img = Image.open(image_source)
+                with bg_img:
+                    bg = _crop_to_fill(bg_img, w, h)
             except Exception:
                 bg = self._create_default_background(w, h)
         else:
             bg = self._create_default_background(w, h)
 
-        # RGBA 변환 및 그라데이션 오버레이
-        card = bg.convert("RGBA")
-        overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-        draw_overlay = ImageDraw.Draw(overlay)
-
-        # 하단 60% 그라데이션
-        gradient_start = int(h * 0.4)
-        for y in range(gradient_start, h):
-            progress = (y - gradient_start) / (h - gradient_start)
-            alpha = int(220 * progress)
-            draw_overlay.line([(0, y), (w, y)], fill=(0, 0, 0, alpha))
+        card = self.template.render(title, category, bg)
+        card.save(output_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+        return card, output_path
 
-        card = Image.alpha_composite(card, overlay)
-        draw = ImageDraw.Draw(card)
-
-        # 폰트
-        title_font = _load_font(52, bold=True)
-        cat_font = _load_font(26, bold=True)
-        brand_font = _load_font(22, bold=False)
-
-        # 카테고리 뱃지 (좌상단)
-        if category:
-            cat_text = f"  {category}  "
-            cat_bbox = draw.textbbox((0, 0), cat_text, font=cat_font)
-            cat_w = cat_bbox[2] - cat_bbox[0]
-            cat_h = cat_bbox[3] - cat_bbox[1]
-            pad = 8
-            draw.rounded_rectangle(
-                [40, 40, 40 + cat_w + pad * 2, 40 + cat_h + pad * 2],
-                radius=8,
-                fill=(220, 50, 50, 200),
-            )
-            draw.text((40 + pad, 40 + pad), cat_text, font=cat_font, fill="white")
-
-        # 제목 (하단)
-        margin = 60
-        max_text_width = w - margin * 2
-        lines = _wrap_text(title, title_font, max_text_width, draw)
-
-        line_height = 64
-        total_text_h = len(lines) * line_height
-        text_y = h - 140 - total_text_h
-
-        for line in lines:
-            # 그림자
-            draw.text((margin + 2, text_y + 2), line, font=title_font, fill=(0, 0, 0, 180))
-            draw.text((margin, text_y), line, font=title_font, fill="white")
-            text_y += line_height
+    def generate_many(self, articles, workers=None, output_dir=None, concurrency=8):
+        """
+        여러 기사의 카드를 프로세스 풀에서 동시에 생성 (끝난 순서대로 결과 반환).
 
-        # 브랜딩 (하단)
-        brand_text = "보스톤코리아  |  bostonkorea.com"
-        draw.text((margin, h - 65), brand_text, font=brand_font, fill=(200, 200, 200, 220))
+        이미지 URL은 이 프로세스에서 공유 이미지 캐시로 받아 두고 워커에는 캐시 파일
+        경로만 넘기며, 워커는 결과를 파일로 저장한 뒤 경로만 돌려줍니다 (이미지 객체를
+        프로세스 사이에 주고받지 않음). 워커는 시작할 때 폰트와 템플릿을 미리 준비합니다.
 
-        card_rgb = card.convert("RGB")
-        card_rgb.save(output_path, "PNG", quality=95)
-        return card_rgb, output_path
+        Args:
+            articles: 기사 dict 목록 ('title', 'category', 'image_url', 'url' 사용.
+                      'output_path'가 있으면 그 경로에 저장)
+            workers: 워커 프로세스 수 (None이면 CPU 수, 1 이하면 이 프로세스에서 차례로 생성)
+            output_dir: 저장 폴더 (None이면 임시 파일)
+            concurrency: 동시에 받을 이미지 수
+
+        Yields:
+            (article, 저장 경로, error) - 성공하면 error는 None, 실패하면 경로가 None
+        """
+        articles = list(articles)
+        if not articles:
+            return
+        workers = min(workers or os.cpu_count() or 1, len(articles))
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        jobs = [(article, self._output_path(article, output_dir)) for article in articles]
+
+        if workers <= 1:
+            for article, output_path in jobs:
+                try:
+                    _, path = self.generate(article.get('title', ''), article.get('category', ''),
+                                            article.get('image_url') or None, output_path)
+                    yield article, path, None
+                except Exception as e:
+                    yield article, None, e
+            return
+
+        template = self.template
+        categories = sorted({article.get('category') or '' for article in articles})
+        # spawn: GUI 스레드가 돌고 있어도 안전하고 Windows(배포 대상)와 같은 방식
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_card_worker,
+            initargs=(template.size, template.theme_name, categories),
+        )
+        fetcher = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            pending = {}
+            for article, output_path in jobs:
+                future = fetcher.submit(_local_image_source, article.get('image_url'))
+                pending[future] = ('fetch', article, output_path)
+
+            # 이미지를 받는 대로 렌더링을 맡기고, 끝난 카드부터 바로 반환
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, article, output_path = pending.pop(future)
+                    if kind == 'fetch':
+                        rendered = pool.submit(_render_card, article.get('title', ''),
+                                               article.get('category', ''), future.result(),
+                                               output_path)
+                        pending[rendered] = ('render', article, output_path)
+                        continue
+                    error = future.exception()
+                    yield article, (None if error else future.result()), error
+        finally:
+            fetcher.shutdown(wait=False, cancel_futures=True)
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _output_path(article, output_dir):
+        """기사별 카드 저장 경로 (같은 URL이면 같은 파일 이름)."""
+        if article.get('output_path'):
+            return article['output_path']
+        if output_dir and article.get('url'):
+            digest = hashlib.sha1(article['url'].encode("utf-8")).hexdigest()[:12]
+            return os.path.join(output_dir, f"card_{digest}.png")
+        fd, path = tempfile.mkstemp(suffix=".png", dir=output_dir)
+        os.close(fd)
+        return path
 
     def _create_default_background(self, w, h):
-        """이미지가 없을 때 기본 그라데이션 배경."""
-        bg = Image.new("RGB", (w, h))
-        draw = ImageDraw.Draw(bg)
-        for y in range(h):
-            r = int(20 + 30 * (y / h))
-            g = int(30 + 20 * (y / h))
-            b = int(60 + 40 * (y / h))
-            draw.line([(0, y), (w, y)], fill=(r, g, b))
-        return bg
+        """이미지가 없을 때 기본 그라데이션 배경 (크기별 캐시의 복사본)."""
+        return _default_background(w, h).copy()
+
+
+def _local_image_source(image_url):
+    """
+    워커에 넘길 배경 이미지 경로. URL이면 공유 이미지 캐시 파일 경로로 바꿈
+    (받지 못하면 None → 기본 배경, generate()와 같은 처리).
+    """
+    if not image_url or not image_url.startswith("http"):
+        return image_url or None
+    try:
+        return get_image_cache().path(image_url)
+    except Exception:
+        return None
+
+
+# ===== generate_many 워커 프로세스 =====
+
+_worker_generator = None
+
+
+def _init_card_worker(size, theme, categories):
+    """워커 시작 시 한 번: 템플릿(폰트, 그라데이션, 카테고리 뱃지)을 미리 준비."""
+    global _worker_generator
+    template = get_card_template(size, theme)
+    template.warmup(categories)
+    _worker_generator = CardGenerator(template=template)
+
+
+def _render_card(title, category, image_path, output_path):
+    """워커에서 카드 한 장을 만들어 저장하고 경로만 반환."""
+    _, path = _worker_generator.generate(title, category, image_path, output_path)
+    return path
+
+
+def _peak_rss_mb():
+    """
+    (이 프로세스, 끝난 자식 프로세스 중 최대) 최대 상주 메모리(MB).
+    Windows에는 resource 모듈이 없으므로 이 프로세스 값만 GetProcessMemoryInfo로
+    구하고 자식 프로세스(인코더) 값은 None.
+    """
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_rss_mb(), None
+    # ru_maxrss 단위: Linux는 KB, macOS는 바이트
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / unit)
+
+
+def _windows_peak_rss_mb():
+    """Windows: 이 프로세스의 PeakWorkingSetSize(MB). 구하지 못하면 None."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        kernel32 = ctypes.WinDLL("kernel32")
+        psapi = ctypes.WinDLL("psapi")
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        psapi.GetProcessMemoryInfo.argtypes = [
+            wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+        psapi.GetProcessMemoryInfo.restype = wintypes.BOOL
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        if not psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(),
+                                          ctypes.byref(counters), counters.cb):
+            return None
+    except (AttributeError, OSError):
+        return None
+    return counters.PeakWorkingSetSize / (1024 * 1024)
+
+
+def _zoom_boxes(w, h, total_frames, zoom=0.10):
+    """
+    프레임별 샘플링 영역 (가운데 기준으로 1.0 → 1.0 + zoom배, 마지막 프레임에서 끝 배율).
+    좌표를 정수로 자르면 프레임마다 가장자리가 앞뒤로 흔들리므로 소수 좌표 그대로 사용.
+    """
+    boxes = []
+    steps = max(total_frames - 1, 1)
+    for i in range(total_frames):
+        scale = 1.0 + zoom * i / steps
+        new_w, new_h = w / scale, h / scale
+        left, top = (w - new_w) / 2, (h - new_h) / 2
+        boxes.append((left, top, left + new_w, top + new_h))
+    return boxes
 
 
 class VideoGenerator:
-    """카드 이미지에서 줌 효과 동영상 생성"""
+    """
+    카드 이미지에서 줌 효과 동영상 생성.
+
+    백엔드:
+    - "ffmpeg": 카드 한 장을 ffmpeg 한 번 실행에 넘기고 zoompan 필터가 프레임 생성과
+      인코딩을 모두 처리 (파이썬에서 프레임을 만들지 않음)
+    - "python": 프레임을 PIL로 만들어 ffmpeg 입력 파이프로 전달
+    - "auto"(기본): ffmpeg 백엔드 (벤치마크에서 더 빠름), 실패하면 python 백엔드
+    """
 
     VIDEO_SIZE = (720, 720)
+    ZOOM = 0.10
+    ZOOMPAN_UPSCALE = 4
+    BACKENDS = ("auto", "ffmpeg", "python")
+
+    def __init__(self, backend="auto", preset=None, crf=None, threads=None):
+        """
+        Args:
+            backend: BACKENDS 중 하나
+            preset: x264 프리셋 (예: "veryfast", None이면 ffmpeg 기본값)
+            crf: 화질 (0~51, 낮을수록 고화질, None이면 ffmpeg 기본값)
+            threads: 인코더 스레드 수 (None이면 ffmpeg 자동)
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"지원하지 않는 동영상 백엔드: {backend}")
+        self.backend = backend
+        self.preset = preset
+        self.crf = crf
+        self.threads = threads
+        # 마지막 generate()의 처리량/메모리 (backend, frames, seconds, fps, render_fps,
+        # peak_rss_mb, encoder_peak_rss_mb). render_fps는 python 백엔드만,
+        # peak RSS는 프로세스 시작 이후 최대값 (Windows에서는 encoder_peak_rss_mb가 None)
+        self.last_stats = None
 
     def generate(self, card_image_path, output_path=None, duration=4, fps=15,
                  on_progress=None):
@@ -224,38 +797,135 @@ class VideoGenerator:
         Returns:
             출력 파일 경로
         """
-        import numpy as np
-        import imageio
-
         if output_path is None:
             fd, output_path = tempfile.mkstemp(suffix=".mp4")
             os.close(fd)
 
-        vw, vh = self.VIDEO_SIZE
-        img = Image.open(card_image_path).convert("RGB").resize(
-            (vw, vh), Image.BILINEAR
-        )
-
-        total_frames = duration * fps
-        writer = imageio.get_writer(output_path, fps=fps, macro_block_size=1)
-
-        for i in range(total_frames):
-            t = i / total_frames
-            zoom = 1.0 + 0.10 * t
+        started = time.perf_counter()
+        total_frames = int(duration * fps)
+        backend = self.backend
+        render_seconds = None
+        if backend in ("auto", "ffmpeg"):
+            try:
+                self._generate_ffmpeg(card_image_path, output_path, total_frames, fps,
+                                      on_progress)
+                backend = "ffmpeg"
+            except (OSError, RuntimeError):
+                if backend == "ffmpeg":
+                    raise
+                backend = "python"
+        if backend == "python":
+            render_seconds = self._generate_python(card_image_path, output_path,
+                                                   total_frames, fps, on_progress)
+
+        seconds = time.perf_counter() - started
+        peak_rss, encoder_peak_rss = _peak_rss_mb()
+        self.last_stats = {
+            "backend": backend,
+            "frames": total_frames,
+            "seconds": seconds,
+            "fps": total_frames / seconds if seconds else 0.0,
+            "render_fps": total_frames / render_seconds if render_seconds else None,
+            "peak_rss_mb": peak_rss,
+            "encoder_peak_rss_mb": encoder_peak_rss,
+        }
+        if on_progress:
+            on_progress(100)
+        return output_path
 
-            new_w = int(vw / zoom)
-            new_h = int(vh / zoom)
-            left = (vw - new_w) // 2
-            top = (vh - new_h) // 2
+    def _encoder_params(self):
+        """프리셋/CRF/스레드 ffmpeg 출력 옵션 (지정한 것만)."""
+        params = []
+        if self.preset:
+            params += ["-preset", self.preset]
+        if self.crf is not None:
+            params += ["-crf", str(self.crf)]
+        if self.threads:
+            params += ["-threads", str(self.threads)]
+        return params
+
+    def _generate_ffmpeg(self, card_image_path, output_path, total_frames, fps, on_progress):
+        """
+        ffmpeg zoompan 필터로 프레임 생성 + 인코딩을 한 번에.
+        진행률은 -progress 출력의 frame= 값으로 계산.
+        """
+        import subprocess
 
-            cropped = img.crop((left, top, left + new_w, top + new_h))
-            resized = cropped.resize((vw, vh), Image.BILINEAR)
-            writer.append_data(np.array(resized))
+        import imageio_ffmpeg
 
-            if on_progress and i % 10 == 0:
-                on_progress(int((i + 1) / total_frames * 100))
+        vw, vh = self.VIDEO_SIZE
+        # python 백엔드와 같은 확대: 720px로 줄인 카드에서 가운데 기준 1.0 → 1.0 + ZOOM배
+        # zoompan은 x/y를 정수 픽셀로 자르므로 원본을 ZOOMPAN_UPSCALE배로 키운 뒤 적용해서
+        # 반올림 오차를 출력 기준 1/ZOOMPAN_UPSCALE 픽셀로 줄임 (그대로 쓰면 프레임마다 흔들림)
+        up = self.ZOOMPAN_UPSCALE
+        steps = max(total_frames - 1, 1)
+        video_filter = (
+            f"scale={vw * up}:{vh * up}:flags=bilinear,"
+            f"zoompan=z='1+{self.ZOOM}*on/{steps}'"
+            f":x='iw/2-iw/zoom/2':y='ih/2-ih/zoom/2'"
+            f":d={total_frames}:s={vw}x{vh}:fps={fps}"
+        )
+        cmd = [
+            imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-hide_banner", "-nostats",
+            "-loglevel", "error",
+            "-i", card_image_path,
+            "-vf", video_filter,
+            "-frames:v", str(total_frames),
+            "-c:v", "libx264",
+            "-pix_fmt", "yuv420p",
+            *self._encoder_params(),
+            "-progress", "pipe:1",
+            output_path,
+        ]
+        # 창 없는 exe(PyInstaller)에서 콘솔 창이 뜨지 않도록
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        last_percent = -1
+        for line in process.stdout:
+            if on_progress and line.startswith("frame="):
+                try:
+                    frame = int(line.split("=", 1)[1])
+                except ValueError:
+                    continue
+                percent = min(99, frame * 100 // max(total_frames, 1))
+                if percent != last_percent:
+                    last_percent = percent
+                    on_progress(percent)
+        errors = process.stderr.read()
+        if process.wait() != 0:
+            raise RuntimeError(f"ffmpeg 동영상 생성 실패: {errors.strip()}")
+
+    def _generate_python(self, card_image_path, output_path, total_frames, fps, on_progress):
+        """
+        프레임마다 원본에서 바로 샘플링 영역을 리샘플링(resize box=)하고 그 바이트를
+        ffmpeg 입력 파이프에 그대로 씀 (crop 사본, numpy 배열 변환 없음).
+        샘플링 영역은 시작 전에 한 번에 계산. 프레임 생성에 쓴 초를 반환.
+        """
+        import imageio_ffmpeg
 
-        writer.close()
-        if on_progress:
-            on_progress(100)
-        return output_path
+        vw, vh = self.VIDEO_SIZE
+        with Image.open(card_image_path) as src:
+            img = src.convert("RGB").resize((vw, vh), Image.BILINEAR)
+
+        boxes = _zoom_boxes(vw, vh, total_frames, self.ZOOM)
+        # imageio.get_writer(..., macro_block_size=1)과 같은 인코딩 설정
+        writer = imageio_ffmpeg.write_frames(
+            output_path, (vw, vh), fps=fps, quality=None, macro_block_size=1,
+            output_params=self._encoder_params())
+        writer.send(None)
+
+        render_seconds = 0.0
+        try:
+            for i, box in enumerate(boxes):
+                frame_start = time.perf_counter()
+                frame = img.resize((vw, vh), Image.BILINEAR, box=box).tobytes()
+                render_seconds += time.perf_counter() - frame_start
+                writer.send(frame)
+
+                if on_progress and i % 10 == 0:
+                    on_progress(int((i + 1) / total_frames * 100))
+        finally:
+            writer.close()
+        return render_seconds
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+메모리 캐시 모듈
+- TTLCache: 항목별 만료 시간을 가진 크기 제한 LRU 캐시 (스레드 안전)
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """크기 제한 LRU + 항목별 TTL 캐시. 값은 복사본으로 주고받음."""
+
+    def __init__(self, maxsize=256, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """유효한 항목이면 값의 복사본 반환, 없거나 만료되었으면 default."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        # 호출한 쪽에서 결과를 수정해도 캐시가 오염되지 않도록 복사
+        return copy.deepcopy(value)
+
+    def set(self, key, value, ttl=None):
+        """값 저장 (ttl을 생략하면 기본 TTL)."""
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key=None, prefix=None):
+        """
+        항목 무효화.
+
+        Args:
+            key: 지정한 키 하나만 삭제
+            prefix: 튜플 키의 첫 요소가 prefix인 항목 모두 삭제
+            (둘 다 없으면 전체 삭제)
+        """
+        with self._lock:
+            if key is not None:
+                self._data.pop(key, None)
+            elif prefix is not None:
+                for k in [k for k in self._data if isinstance(k, tuple) and k and k[0] == prefix]:
+                    del self._data[k]
+            else:
+                self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self):
+        return len(self._data)
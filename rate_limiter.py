@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+요청 속도 제한 모듈 - 프로세스 전체가 공유하는 호스트별 토큰 버킷
+- TokenBucket: 초당 rate개, 최대 burst개까지 몰아서 허용
+- RateLimiter: 호스트별 버킷 관리. 429/503 응답(Retry-After 포함)을 받으면
+  해당 호스트로 가는 모든 요청을 멈추고 속도를 절반으로 낮춘 뒤,
+  성공 응답이 이어지면 원래 속도로 서서히 복구
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# 호스트별 (초당 요청 수, 버스트). 목록에 없는 호스트는 DEFAULT_RATE
+HOST_RATES = {
+    'www.bostonkorea.com': (5.0, 10),
+}
+DEFAULT_RATE = (10.0, 20)
+
+# 서버가 Retry-After 없이 429/503을 보냈을 때 기본 대기 시간 (초)
+DEFAULT_BACKOFF = 5.0
+# Retry-After 상한 (초). 잘못되었거나 지나치게 긴 값으로 호스트가 오래 멈추지 않도록
+MAX_RETRY_AFTER = 120.0
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value):
+    """
+    Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환 (최대 MAX_RETRY_AFTER).
+    음수이거나 해석할 수 없으면 None. 이미 지난 날짜는 0.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), MAX_RETRY_AFTER)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    delay = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(0.0, delay), MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """토큰 버킷. 토큰이 모자라면 빚을 지고 그만큼 기다리는 예약 방식."""
+
+    # 429/503 이후 최저 속도 비율과 성공 1회당 복구 비율
+    MIN_FACTOR = 0.1
+    RECOVERY_STEP = 0.05
+
+    def __init__(self, rate, burst):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        # 마지막 충전 시각. 정지 중에는 정지 해제 시각(미래)을 가리킴
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초) 반환."""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            # 정지 중이면 해제 시각까지 + 밀린 토큰만큼 추가 대기
+            wait = self._updated - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def throttle(self, delay):
+        """delay초 동안 전체 정지 + 속도 절반. 정지 동안에는 토큰이 쌓이지 않음."""
+        with self._lock:
+            until = time.monotonic() + delay
+            if until > self._updated:
+                self._updated = until
+            self.rate = max(self.base_rate * self.MIN_FACTOR, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def recover(self):
+        """성공 응답마다 조금씩 원래 속도로 복구."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * self.RECOVERY_STEP)
+
+
+class RateLimiter:
+    """호스트별 토큰 버킷 모음"""
+
+    def __init__(self, host_rates=None, default_rate=DEFAULT_RATE):
+        self._host_rates = dict(HOST_RATES)
+        if host_rates:
+            self._host_rates.update(host_rates)
+        self._default_rate = default_rate
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    rate, burst = self._host_rates.get(host, self._default_rate)
+                    bucket = TokenBucket(rate, burst)
+                    self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, host):
+        """요청을 보내도 될 때까지 대기."""
+        wait = self.bucket(host).reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def feedback(self, host, status_code, retry_after=None) -> bool:
+        """
+        응답 상태를 반영. 429/503이면 호스트 전체를 늦추고 True 반환.
+        """
+        bucket = self.bucket(host)
+        if status_code in THROTTLE_STATUSES:
+            delay = parse_retry_after(retry_after)
+            bucket.throttle(DEFAULT_BACKOFF if delay is None else delay)
+            return True
+        bucket.recover()
+        return False
+
+    def stats(self) -> dict:
+        """호스트별 현재 속도 (초당 요청 수)."""
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+
+_default_limiter = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 전역 공유 RateLimiter 반환."""
+    global _default_limiter
+    if _default_limiter is None:
+        with _default_lock:
+            if _default_limiter is None:
+                _default_limiter = RateLimiter()
+    return _default_limiter
@@ -5,9 +5,9 @@
 - InstagramPoster: instagrapi를 사용한 인스타그램 포스팅
 """
 
-import os
-import tempfile
-import requests
+from pathlib import Path
+
+from image_cache import get_image_cache
 
 
 class XPoster:
@@ -52,23 +52,11 @@ class InstagramPoster:
         """이미지 다운로드 후 인스타그램에 게시. 성공 시 미디어 ID 반환."""
         self._login()
 
-        # 이미지 다운로드
-        tmp_path = None
-        try:
-            resp = requests.get(image_url, timeout=30)
-            resp.raise_for_status()
-
-            suffix = ".jpg"
-            tmp_fd, tmp_path = tempfile.mkstemp(suffix=suffix)
-            os.close(tmp_fd)
-            with open(tmp_path, "wb") as f:
-                f.write(resp.content)
-
-            media = self.client.photo_upload(tmp_path, caption)
-            return str(media.pk)
-        finally:
-            if tmp_path and os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        # 카드 생성 때 받아 둔 원본을 공유 이미지 캐시에서 재사용
+        # (photo_upload는 JPEG만 받으므로 PNG/WEBP 원본은 JPEG 사본 사용)
+        image_path = get_image_cache().jpeg_path(image_url)
+        media = self.client.photo_upload(Path(image_path), caption)
+        return str(media.pk)
 
     def test_connection(self) -> bool:
         """로그인 테스트."""
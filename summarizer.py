@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+추출 요약 모듈 - 외부 모델/네트워크 없이 NumPy만으로 기사 본문 요약
+- 문장 분리 후 사진 설명, 기자 바이라인, 저작권 문구 등 요약에 쓸 수 없는 문장 제거
+- 문장별 글자 n-gram(2~3) TF-IDF 벡터 → 코사인 유사도 행렬 → TextRank
+  (앞 문장에 약간의 가중치를 주는 개인화 PageRank)
+- 점수 높은 문장부터 글자 수 제한 안에서 골라 원래 순서대로 이어 붙임
+
+summarize_many()는 여러 기사의 유사도 행렬을 (기사 수, 문장 수, 문장 수) 배열로
+쌓아 TextRank 반복을 한꺼번에 계산합니다.
+"""
+
+import re
+
+import numpy as np
+
+# 글자 n-gram 길이
+NGRAM_RANGE = (2, 3)
+# TextRank 감쇠 계수와 반복 횟수
+DAMPING = 0.85
+MAX_ITER = 50
+TOLERANCE = 1e-6
+# 기사 앞쪽 문장 가중치 (i번째 문장: 1 / (i + 1) ** LEAD_BIAS)
+LEAD_BIAS = 0.5
+# 너무 짧은 문장은 요약 후보에서 제외 (글자 수)
+MIN_SENTENCE_LENGTH = 10
+# 한 기사에서 고려할 최대 문장 수 (본문은 이미 2000자로 잘려 있음)
+MAX_SENTENCES = 80
+
+_SENTENCE_END_RE = re.compile(r'(?<=[.?!。])\s+|\n+')
+_SPACE_RE = re.compile(r'\s+')
+# 문장 앞의 "(보스톤 = 보스톤코리아) 홍길동 기자 =" 같은 데이트라인
+_DATELINE_RE = re.compile(r'^\s*[(\[][^)\]]*=[^)\]]*[)\]]\s*(?:[^\s=]+\s*){0,3}기자\s*=\s*')
+_NOISE_RES = (
+    re.compile(r'^\s*[(\[<]?\s*(사진|그래픽|자료|영상|출처)\s*[=:/]'),  # 사진 설명
+    re.compile(r'^\s*[(\[][^)\]]*[)\]]\s*$'),                         # 괄호만 있는 줄
+    re.compile(r'기자\s*=?\s*$'),                                      # 바이라인만 남은 줄
+    re.compile(r'[\w.+-]+@[\w-]+\.[\w.]+'),                            # 이메일
+    re.compile(r'ⓒ|©|저작권자|무단\s*전재|재배포\s*금지'),                # 저작권 문구
+)
+
+
+def split_sentences(text: str) -> list:
+    """본문을 문장 리스트로 분리 (요약에 쓸 수 없는 문장은 제외)"""
+    sentences = []
+    for piece in _SENTENCE_END_RE.split(text or ''):
+        piece = _DATELINE_RE.sub('', piece.strip())
+        if len(piece) < MIN_SENTENCE_LENGTH:
+            continue
+        if any(pattern.search(piece) for pattern in _NOISE_RES):
+            continue
+        sentences.append(piece)
+        if len(sentences) >= MAX_SENTENCES:
+            break
+    return sentences
+
+
+def _ngram_codes(sentences: list):
+    """
+    문장들의 글자 n-gram(공백 제외)을 정수 하나씩으로 인코딩.
+    유니코드 코드포인트(21비트)를 이어 붙이므로 서로 다른 n-gram은 항상 다른 값.
+
+    Returns:
+        (문장 번호 배열, n-gram 코드 배열)
+    """
+    stripped = [_SPACE_RE.sub('', sentence) for sentence in sentences]
+    lengths = np.array([len(text) for text in stripped])
+    ends = np.cumsum(lengths)
+    chars = np.frombuffer(''.join(stripped).encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+    owner = np.repeat(np.arange(len(sentences)), lengths)
+
+    rows = []
+    codes = []
+    low, high = NGRAM_RANGE
+    for n in range(low, high + 1):
+        count = len(chars) - n + 1
+        if count <= 0:
+            break
+        code = chars[:count].copy()
+        for k in range(1, n):
+            code = (code << 21) | chars[k:k + count]
+        # 문장 경계를 넘는 n-gram 제외
+        row = owner[:count]
+        valid = np.arange(count) + n <= ends[row]
+        rows.append(row[valid])
+        codes.append(code[valid])
+    if not codes:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(rows), np.concatenate(codes)
+
+
+def _tfidf(sentences: list) -> np.ndarray:
+    """문장별 글자 n-gram TF-IDF 행렬 (행 단위 L2 정규화)"""
+    rows, codes = _ngram_codes(sentences)
+    vocab, cols = np.unique(codes, return_inverse=True)
+
+    width = max(len(vocab), 1)
+    counts = np.bincount(rows * width + cols.reshape(-1), minlength=len(sentences) * width)
+    counts = counts.reshape(len(sentences), width).astype(np.float32)
+
+    present = counts > 0
+    tf = np.zeros_like(counts)
+    np.log(counts, out=tf, where=present)
+    tf[present] += 1.0
+    df = present.sum(axis=0)
+    idf = np.log((1.0 + len(sentences)) / (1.0 + df)) + 1.0
+    matrix = tf * idf.astype(np.float32)
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _textrank(similarity: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    (B, N, N) 유사도 행렬과 (B, N) 유효 문장 마스크로 문장 점수 계산.
+    패딩 문장은 0점.
+    """
+    similarity = similarity * mask[:, :, None] * mask[:, None, :]
+    idx = np.arange(similarity.shape[1])
+    similarity[:, idx, idx] = 0.0
+
+    # 개인화 벡터: 앞 문장일수록 조금 더 중요
+    prior = mask / (idx[None, :] + 1.0) ** LEAD_BIAS
+    prior /= np.maximum(prior.sum(axis=1, keepdims=True), 1e-12)
+
+    # 행 정규화한 전이 행렬. 연결이 없는 문장은 prior로 이동
+    out_weight = similarity.sum(axis=2, keepdims=True)
+    dangling = out_weight[:, :, 0] == 0
+    transition = np.divide(similarity, out_weight, out=np.zeros_like(similarity),
+                           where=out_weight > 0)
+
+    scores = prior.copy()
+    for _ in range(MAX_ITER):
+        leaked = (scores * dangling).sum(axis=1, keepdims=True)
+        updated = np.einsum('bi,bij->bj', scores, transition) + leaked * prior
+        updated = DAMPING * updated + (1 - DAMPING) * prior
+        converged = np.abs(updated - scores).max() < TOLERANCE
+        scores = updated
+        if converged:
+            break
+    return scores * mask
+
+
+def _select(sentences: list, scores: np.ndarray, max_length: int) -> str:
+    """점수 순으로 max_length 안에 들어가는 문장을 골라 원래 순서로 연결"""
+    chosen = []
+    length = 0
+    for i in np.argsort(-scores[:len(sentences)], kind='stable'):
+        extra = len(sentences[i]) + (1 if chosen else 0)
+        if length + extra <= max_length:
+            chosen.append(i)
+            length += extra
+
+    if not chosen:
+        # 가장 중요한 문장 하나도 들어가지 않으면 잘라서 사용
+        best = sentences[int(np.argmax(scores[:len(sentences)]))]
+        return best[:max(max_length - 3, 0)].rstrip() + '...'
+    return ' '.join(sentences[i] for i in sorted(chosen))
+
+
+def _lead_text(content, max_length):
+    """
+    요약 후보 문장이 하나도 없을 때(짧은 문장뿐인 단신, 사진 기사) 본문 앞부분을
+    줄바꿈 없이 이어 max_length 안으로 잘라 사용.
+    """
+    text = _SPACE_RE.sub(' ', _DATELINE_RE.sub('', (content or '').strip())).strip()
+    if len(text) <= max_length:
+        return text
+    return text[:max(max_length - 3, 0)].rstrip() + '...'
+
+
+def summarize_many(contents, max_length: int = 200) -> list:
+    """
+    여러 본문을 한 번에 요약.
+
+    Args:
+        contents: 본문 문자열 리스트
+        max_length: 요약 최대 글자 수
+
+    Returns:
+        contents와 같은 순서의 요약 문자열 리스트
+    """
+    contents = list(contents)
+    docs = [split_sentences(content) for content in contents]
+    size = max((len(doc) for doc in docs), default=0)
+    if size == 0:
+        return [_lead_text(content, max_length) for content in contents]
+
+    similarity = np.zeros((len(docs), size, size), dtype=np.float32)
+    mask = np.zeros((len(docs), size), dtype=np.float32)
+    for b, doc in enumerate(docs):
+        if not doc:
+            continue
+        vectors = _tfidf(doc)
+        similarity[b, :len(doc), :len(doc)] = vectors @ vectors.T
+        mask[b, :len(doc)] = 1.0
+
+    scores = _textrank(similarity, mask)
+    return [_select(doc, scores[b], max_length) if doc else _lead_text(contents[b], max_length)
+            for b, doc in enumerate(docs)]
+
+
+def summarize(content: str, max_length: int = 200) -> str:
+    """본문 하나 요약 (summarize_many의 단건 버전)"""
+    return summarize_many([content], max_length)[0]
@@ -0,0 +1,122 @@
+from bostonkorea_bot import BostonKoreaBot
+from dedup import DuplicateIndex
+from hashtags import KeywordIndex
+from http_cache import HttpCache
+
+
+def _board_html(titles):
+    """webzineList 목록 HTML (titles는 최신순 (번호, 제목))."""
+    items = "".join(
+        f'<li><a href="/news/{number}"><div class="bo_tit"><strong>{title}</strong></div></a></li>'
+        for number, title in titles)
+    return f'<div class="webzineList"><ul>{items}</ul></div>'.encode()
+
+
+class _Response:
+    status_code = 200
+    ok = True
+    headers = {}
+
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class _Client:
+    def __init__(self, content):
+        self.content = content
+
+    def get(self, url, **kwargs):
+        return _Response(self.content)
+
+
+def test_cached_list_keeps_duplicate_marks(tmp_path):
+    """메모리 캐시에서 돌려준 목록에도 duplicate_of가 있어야 함."""
+    html = _board_html([
+        (3, "[속보] 보스톤 시의회, 새 예산안 통과 주민 의견 수렴"),
+        (2, "MBTA 그린라인 연장 구간 개통 소식"),
+        (1, "보스톤 시의회, 새 예산안 통과 주민 의견 수렴"),
+    ])
+    bot = BostonKoreaBot(http=_Client(html), cache=HttpCache(str(tmp_path)),
+                         keywords=KeywordIndex(path=None), dedup=DuplicateIndex(path=None))
+
+    fresh = bot.fetch_latest_articles(refresh=True)
+    cached = bot.fetch_latest_articles()
+
+    expected = [f"{BostonKoreaBot.BASE_URL}/news/1", None, None]
+    assert [item["duplicate_of"] for item in fresh] == expected
+    assert [item["duplicate_of"] for item in cached] == expected
+
+
+BODY = (
+    "보스톤 시의회가 15일 정례회의에서 내년도 예산안을 찬성 9표, 반대 4표로 통과시켰다. "
+    "이번 예산안은 공립학교 교사 채용 확대와 노후 도로 보수, 저소득층 주거 지원 사업에 "
+    "중점을 두었으며 시는 주민 공청회에서 나온 의견을 반영해 일부 항목을 조정했다고 밝혔다. "
+    "시장은 성명을 내고 주민들의 삶을 실질적으로 개선하는 예산이라고 평가했다."
+)
+
+
+def _article(number, title, content=""):
+    return {"url": f"https://www.bostonkorea.com/news/{number}", "title": title,
+            "content": content}
+
+
+def test_series_titles_with_different_numbers_are_not_duplicates():
+    """번호만 다른 연재 칼럼은 제목 자카드가 높아도 중복이 아님."""
+    index = DuplicateIndex(path=None)
+    first = _article(1, "[칼럼] 이민법 바로알기 (123)")
+    second = _article(2, "[칼럼] 이민법 바로알기 (124)")
+    index.add(first)
+    index.add(second)
+
+    assert index.duplicate_of(second) is None
+    assert index.find(second) == []
+
+
+def test_truncated_list_title_matches_full_article():
+    """목록의 55자 + '...' 제목은 원래 기사 제목과 같은 기사로 판정."""
+    index = DuplicateIndex(path=None)
+    title = ("매사추세츠 주정부, 내년부터 최저임금 15달러로 인상… "
+             "소상공인 부담 우려 목소리도 커져 대책 마련 요구, 주의회는 세금 감면 법안 검토 착수")
+    # 잘린 부분이 길어서 전체 제목끼리 비교하면 자카드 유사도가 기준에 못 미침
+    assert len(title) > 55 * 1.3
+    article = _article(10, title, BODY)
+    index.add(article)
+
+    list_item = _article(11, title[:55] + "...")
+    assert index.duplicate_of(list_item) == article["url"]
+
+
+def test_body_canonical_is_earliest_registered():
+    """본문이 거의 같은 기사들은 가장 먼저 등록된 URL로 모임."""
+    index = DuplicateIndex(path=None)
+    original = _article(20, "보스톤 시의회, 내년도 예산안 통과", BODY)
+    repost = _article(21, "[수정] 시의회 예산안 가결… 교사 채용 확대",
+                      BODY.replace("15일", "지난 15일"))
+    other = _article(22, "MBTA 그린라인 연장 구간 개통",
+                     "MBTA가 그린라인 연장 구간을 개통했다. 메드포드와 서머빌 주민의 "
+                     "출퇴근 시간이 크게 줄어들 것으로 기대된다.")
+    for article in (original, repost, other):
+        index.add(article)
+
+    assert index.canonical(repost) == original["url"]
+    assert index.canonical(original) == original["url"]
+    assert index.duplicate_of(other) is None
+
+
+def test_posted_duplicate_after_mark_posted():
+    """게시 기록은 같은 기사와 비슷한 기사 모두에 대해 조회되고, 플랫폼별로 구분됨."""
+    index = DuplicateIndex(path=None)
+    original = _article(30, "보스톤 시의회, 내년도 예산안 통과", BODY)
+    repost = _article(31, "[속보] 보스톤 시의회, 내년도 예산안 통과", BODY)
+    index.add(original)
+    index.add(repost)
+
+    assert index.posted_duplicate(repost, "x") is None
+    index.mark_posted(original, "x")
+
+    assert index.posted_duplicate(original, "x") == original["url"]
+    assert index.posted_duplicate(repost, "x") == original["url"]
+    assert index.posted_duplicate(repost, "instagram") is None
@@ -0,0 +1,13 @@
+from hashtags import KeywordIndex
+
+
+def test_hashtags_drop_characters_that_end_a_tag():
+    """'&'에서 해시태그가 끊기지 않도록 태그에서 제거 (AT&T → #ATT)."""
+    index = KeywordIndex(path=None)
+    article = {"url": "https://example.com/1", "title": "AT&T 요금 인상 발표",
+               "content": "AT&T가 다음 달부터 요금을 올린다. AT&T 가입자 반발."}
+
+    assert "AT&T" in index.keywords(article)
+    tags = index.hashtags(article)
+    assert "#ATT" in tags
+    assert all("&" not in tag for tag in tags)
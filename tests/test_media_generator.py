@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from media_generator import _crop_to_fill
+
+
+def _gradient_jpeg(path, size):
+    """가로/세로 방향 색 변화가 있는 JPEG (크롭 위치가 틀리면 결과 색이 달라짐)."""
+    w, h = size
+    y, x = np.mgrid[0:h, 0:w]
+    pixels = np.stack([x / w * 255, y / h * 255, np.full((h, w), 128)], axis=2)
+    Image.fromarray(pixels.astype(np.uint8)).save(path, quality=95)
+    return path
+
+
+@pytest.mark.parametrize("size", [(4001, 3000), (3000, 4001), (5001, 3333), (2161, 1081),
+                                  (1087, 1083)])
+def test_crop_to_fill_odd_jpeg_sizes(tmp_path, size):
+    """draft()가 축마다 따로 올림하는 홀수 크기에서도 실패하지 않고 같은 영역을 잘라야 함."""
+    path = _gradient_jpeg(tmp_path / "photo.jpg", size)
+
+    with Image.open(path) as img:
+        result = _crop_to_fill(img, 1080, 1080)
+    assert result.size == (1080, 1080)
+    assert result.mode == "RGB"
+
+    # draft 없이 전체 디코딩한 가운데 정사각형과 비교
+    with Image.open(path) as img:
+        full = img.convert("RGB")
+    w, h = full.size
+    side = min(w, h)
+    left, top = (w - side) / 2, (h - side) / 2
+    expected = full.resize((1080, 1080), Image.LANCZOS,
+                           box=(left, top, left + side, top + side))
+    diff = np.abs(np.asarray(result, dtype=int) - np.asarray(expected, dtype=int))
+    assert diff.mean() < 2
+
+
+def _edge_positions(video_path, row=360, lo=300, hi=335):
+    """프레임마다 row 행에서 [lo, hi) 구간의 줄무늬 경계 위치 (밝기 128 교차점, 소수 픽셀)."""
+    imageio = pytest.importorskip("imageio")
+    positions = []
+    for frame in imageio.get_reader(video_path):
+        line = frame[row, :, 0].astype(float)
+        crossings = [i + (128 - line[i]) / (line[i + 1] - line[i]) for i in range(lo, hi)
+                     if min(line[i], line[i + 1]) < 128 <= max(line[i], line[i + 1])]
+        positions.append(crossings[-1])
+    return np.array(positions)
+
+
+def test_video_backends_zoom_smoothly_and_match(tmp_path):
+    """두 백엔드 모두 경계가 한 방향으로만 움직이고 (흔들림 없음) 프레임별 위치가 같아야 함."""
+    pytest.importorskip("imageio_ffmpeg")
+    from media_generator import VideoGenerator
+
+    # 60px 간격 세로 줄무늬 (720px 영상에서는 40px 간격, x=320 경계가 가운데 쪽 기준)
+    x = np.arange(1080)
+    column = ((x // 60) % 2 * 255).astype(np.uint8)
+    card = np.repeat(np.broadcast_to(column[None, :], (1080, 1080))[..., None], 3, axis=2)
+    card_path = tmp_path / "stripes.png"
+    Image.fromarray(card).save(card_path)
+
+    edges = {}
+    for backend in ("python", "ffmpeg"):
+        output = tmp_path / f"{backend}.mp4"
+        VideoGenerator(backend).generate(str(card_path), str(output), duration=2, fps=15)
+        edges[backend] = _edge_positions(str(output))
+
+    for backend, positions in edges.items():
+        assert len(positions) == 30
+        # 가운데에서 바깥으로만 이동 (코덱 오차 수준을 넘는 역방향 이동 없음)
+        assert np.diff(positions).max() < 0.25, backend
+        # 마지막 프레임이 1 + ZOOM배: 경계 320 → 360 - 40 * 1.1 = 316
+        assert positions[-1] == pytest.approx(316, abs=0.6), backend
+    assert np.abs(edges["python"] - edges["ffmpeg"]).max() < 1.0
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from rate_limiter import MAX_RETRY_AFTER, TokenBucket, parse_retry_after
+
+
+def _http_date(delta):
+    return format_datetime(datetime.now(timezone.utc) + delta, usegmt=True)
+
+
+def test_retry_after_seconds_are_capped():
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after(" 7 ") == 7.0
+    assert parse_retry_after("86400") == MAX_RETRY_AFTER
+    assert parse_retry_after(_http_date(timedelta(days=2))) == MAX_RETRY_AFTER
+
+
+@pytest.mark.parametrize("value", [None, "", "   ", "-5", "1.5", "abc", "Wed, 99 Foo"])
+def test_invalid_retry_after_is_ignored(value):
+    assert parse_retry_after(value) is None
+
+
+def test_past_http_date_means_retry_now():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after(_http_date(timedelta(minutes=-5))) == 0.0
+
+
+def test_future_http_date_is_seconds_until_then():
+    assert parse_retry_after(_http_date(timedelta(seconds=60))) == pytest.approx(60, abs=2)
+
+
+def test_throttle_delays_later_reservations():
+    """throttle(delay) 뒤의 예약은 최소 delay만큼 기다리고 속도는 절반으로."""
+    bucket = TokenBucket(rate=10.0, burst=5)
+    assert bucket.reserve() == 0
+
+    bucket.throttle(2.0)
+    waits = [bucket.reserve() for _ in range(3)]
+
+    assert all(wait >= 2.0 - 0.05 for wait in waits)
+    # 정지 동안 토큰이 쌓이지 않으므로 뒤 예약일수록 더 기다림 (절반 속도 = 0.2초 간격)
+    assert waits[1] - waits[0] == pytest.approx(0.2, abs=0.02)
+    assert bucket.rate == 5.0
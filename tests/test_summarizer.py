@@ -0,0 +1,20 @@
+from summarizer import summarize, summarize_many
+
+
+def test_short_sentences_fall_back_to_leading_text():
+    """요약 후보 문장이 없는 단신/사진 기사도 빈 요약 대신 본문 앞부분을 사용."""
+    assert summarize("레드삭스 우승\n팬들 환호") == "레드삭스 우승 팬들 환호"
+    assert summarize("") == ""
+
+    # 일부만 후보 문장이 없는 배치에서도 같은 처리
+    long_article = "보스톤 레드삭스가 월드시리즈에서 우승했다. 팬들은 거리로 나와 환호했다."
+    summaries = summarize_many(["레드삭스 우승\n팬들 환호", long_article], max_length=20)
+    assert summaries[0] == "레드삭스 우승 팬들 환호"
+    assert summaries[1] and len(summaries[1]) <= 20
+
+
+def test_leading_text_is_cut_to_max_length():
+    text = "\n".join(["짧은 줄"] * 30)
+    summary = summarize(text, max_length=20)
+    assert len(summary) <= 20
+    assert summary.endswith("...")
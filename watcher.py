@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+새 기사 감시기 - 게시판 목록을 주기적으로 확인해서 새 기사만 전달
+- ArticleWatcher: 이미 본 URL 집합(파일에 저장)과 비교해 새 기사만 상세 조회 후
+  콜백/큐로 전달. 폴링 간격은 관측된 기사 게시 빈도에 맞춰 자동 조정
+  (뉴스가 많은 낮에는 짧게, 새벽에는 길게)
+
+사용법:
+    python watcher.py [--category 경제] [--once]
+"""
+
+import argparse
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from config_manager import WATCHER_STATE
+
+try:
+    from zoneinfo import ZoneInfo
+    _BOSTON_TZ = ZoneInfo("America/New_York")
+except Exception:
+    # Windows에서 tzdata가 없으면 로컬 시간 사용
+    _BOSTON_TZ = None
+
+
+def _state_path(category):
+    """카테고리별 상태 파일 (전체는 watcher_state.json, 경제는 watcher_state_경제.json)."""
+    if not category:
+        return WATCHER_STATE
+    root, ext = os.path.splitext(WATCHER_STATE)
+    safe = re.sub(r'[\\/:*?"<>|\s]+', '_', category)
+    return f"{root}_{safe}{ext}"
+
+
+class ArticleWatcher:
+    """새 기사 감시기"""
+
+    # 새 기사 사이 예상 간격 대비 폴링 간격 비율 (간격의 1/4마다 확인)
+    POLL_FRACTION = 0.25
+    # 게시 간격 이동평균 가중치
+    GAP_ALPHA = 0.3
+    # 초기 게시 간격 추정치 (초)
+    INITIAL_GAP = 20 * 60
+
+    def __init__(self, bot, on_article=None, queue=None, category=None,
+                 state_path=None, min_interval=60, max_interval=30 * 60,
+                 night_hours=(0, 6), max_seen=5000, emit_existing=False):
+        """
+        Args:
+            bot: BostonKoreaBot 인스턴스
+            on_article: 새 기사(fetch_article 결과 dict)마다 호출되는 콜백
+            queue: 새 기사를 넣을 queue.Queue (콜백 대신 또는 함께 사용)
+            category: 감시할 sca 값 (None이면 전체)
+            state_path: 이미 본 URL 목록 저장 파일 (None이면 카테고리별 기본 파일)
+            min_interval, max_interval: 폴링 간격 범위 (초)
+            night_hours: (시작, 끝) 보스톤 시각. 이 시간대에는 max_interval로 폴링
+            max_seen: 기억할 URL 최대 개수
+            emit_existing: 처음 실행 시 목록에 있는 기사도 전달할지 여부
+        """
+        self.bot = bot
+        self.on_article = on_article
+        self.queue = queue
+        self.category = category
+        # 카테고리마다 목록이 다르므로 본 URL 집합과 게시 간격도 따로 저장
+        self.state_path = state_path or _state_path(category)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.night_hours = night_hours
+        self.emit_existing = emit_existing
+
+        self._seen = deque(maxlen=max_seen)
+        self._seen_set = set()
+        self._gap = self.INITIAL_GAP
+        self._last_arrival = None
+        self._empty_polls = 0
+        self._stop = threading.Event()
+        self._load_state()
+
+    # ===== 상태 저장 =====
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        for url in state.get("seen", []):
+            self._remember(url)
+        self._gap = state.get("gap", self._gap)
+        self._last_arrival = state.get("last_arrival")
+
+    def _save_state(self):
+        state = {
+            "seen": list(self._seen),
+            "gap": self._gap,
+            "last_arrival": self._last_arrival,
+        }
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, self.state_path)
+
+    def _remember(self, url):
+        if url in self._seen_set:
+            return
+        if len(self._seen) == self._seen.maxlen:
+            self._seen_set.discard(self._seen[0])
+        self._seen.append(url)
+        self._seen_set.add(url)
+
+    # ===== 폴링 =====
+
+    def _record_arrival(self, now):
+        """새 기사 발견 시각으로 게시 간격 이동평균 갱신."""
+        if self._last_arrival is not None:
+            gap = max(now - self._last_arrival, self.min_interval)
+            self._gap = self.GAP_ALPHA * gap + (1 - self.GAP_ALPHA) * self._gap
+        self._last_arrival = now
+
+    def poll_once(self) -> list:
+        """
+        목록을 한 번 확인해서 새 기사를 상세 조회 후 전달.
+
+        Returns:
+            전달한 기사 dict 리스트 (오래된 것부터)
+        """
+        listing = self.bot.fetch_latest_articles(category=self.category, limit=15)
+        first_run = not self._seen
+
+        if first_run and not self.emit_existing:
+            for item in listing:
+                self._remember(item['url'])
+            self._save_state()
+            return []
+
+        new_items = [item for item in listing if item['url'] not in self._seen_set]
+        emitted = []
+        try:
+            # 목록은 최신순이므로 오래된 것부터 전달.
+            # 상세 조회에 실패한 기사는 기억하지 않으므로 다음 폴링에서 다시 시도.
+            for item in reversed(new_items):
+                article = self.bot.fetch_article(item['url'])
+                self._remember(item['url'])
+                emitted.append(article)
+                if self.on_article:
+                    self.on_article(article)
+                if self.queue is not None:
+                    self.queue.put(article)
+        finally:
+            if emitted:
+                self._record_arrival(time.time())
+                self._empty_polls = 0
+            else:
+                self._empty_polls += 1
+            self._save_state()
+        return emitted
+
+    def next_interval(self) -> float:
+        """다음 폴링까지 대기 시간 (초)."""
+        now = datetime.now(_BOSTON_TZ) if _BOSTON_TZ else datetime.now()
+        night_start, night_end = self.night_hours
+        if night_start <= now.hour < night_end:
+            return self.max_interval
+
+        interval = self._gap * self.POLL_FRACTION
+        # 새 기사가 없는 폴링이 이어지면 점점 늘림 (최대 약 7.6배)
+        interval *= 1.5 ** min(self._empty_polls, 5)
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def run(self, on_error=None):
+        """stop()이 호출될 때까지 폴링 반복."""
+        self._stop.clear()
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                self._empty_polls += 1
+                if on_error:
+                    on_error(e)
+            self._stop.wait(self.next_interval())
+
+    def start(self, on_error=None) -> threading.Thread:
+        """백그라운드 스레드에서 run() 시작."""
+        thread = threading.Thread(target=self.run, args=(on_error,), daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+
+def main():
+    from bostonkorea_bot import BostonKoreaBot
+    from article_store import ArticleStore
+
+    parser = argparse.ArgumentParser(description="보스톤코리아 새 기사 감시기")
+    parser.add_argument("--category", default=None, help="감시할 카테고리 (기본: 전체)")
+    parser.add_argument("--once", action="store_true", help="한 번만 확인하고 종료")
+    args = parser.parse_args()
+
+    bot = BostonKoreaBot()
+    store = ArticleStore()
+
+    def on_article(article):
+        store.upsert(article)
+        cat_tag = f"[{article['category']}] " if article['category'] else ""
+        print(f"🆕 {cat_tag}{article['title']}\n   {article['url']}")
+
+    def on_error(error):
+        print(f"❌ 오류 발생: {error}")
+
+    watcher = ArticleWatcher(bot, on_article=on_article, category=args.category)
+
+    if args.once:
+        watcher.poll_once()
+        return
+
+    print("👀 새 기사 감시 중... (Ctrl+C로 종료)")
+    try:
+        watcher.run(on_error=on_error)
+    except KeyboardInterrupt:
+        print("\n👋 종료합니다.")
+
+
+if __name__ == "__main__":
+    main()